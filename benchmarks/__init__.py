@@ -0,0 +1,3 @@
+"""
+Benchmarks for the generated runtime and CLI. Run with `uv run python -m benchmarks.<name>`.
+"""
@@ -0,0 +1,74 @@
+"""Compare the type-aware param encoder with plain quote() on realistic values.
+
+uv run python -m benchmarks.encoding
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import tempfile
+import timeit
+import uuid
+from pathlib import Path
+from urllib.parse import quote
+
+import typer
+
+from benchmarks.support import load_generated_module, synthetic_routes_json
+
+
+def _workloads(size: int) -> dict[str, list[object]]:
+    rng = random.Random(0)
+    slug_chars = string.ascii_lowercase + string.digits + "-"
+    return {
+        "int ids": [rng.randrange(1, 10**9) for _ in range(size)],
+        "uuids": [uuid.UUID(int=rng.getrandbits(128)) for _ in range(size)],
+        "ascii slugs": [
+            "".join(rng.choice(slug_chars) for _ in range(rng.randrange(6, 30)))
+            for _ in range(size)
+        ],
+        "needs escaping": [
+            f"{rng.choice(['café', 'a b', 'x/y', 'q&a'])}-{i}" for i in range(size)
+        ],
+    }
+
+
+def main(
+    size: int = typer.Option(10_000, help="Values per workload"),
+    repeat: int = typer.Option(20, help="Passes over each workload"),
+) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        routes = load_generated_module(
+            synthetic_routes_json(20), Path(tmp), "bench_encoding_routes"
+        )
+
+    route = routes.ROUTES_BY_PATTERN["/orgs/:orgId/section1/:itemId"]
+
+    for name, values in _workloads(size).items():
+        assert [routes._encode_param(v) for v in values] == [
+            quote(str(v), safe="") for v in values
+        ]
+
+        quoted = timeit.timeit(
+            lambda values=values: [quote(str(v), safe="") for v in values],
+            number=repeat,
+        )
+        fast = timeit.timeit(
+            lambda values=values: [routes._encode_param(v) for v in values],
+            number=repeat,
+        )
+        built = timeit.timeit(
+            lambda values=values: [route.path(org_id=v, item_id=v) for v in values],
+            number=repeat,
+        )
+        calls = size * repeat
+        typer.echo(
+            f"{name:>15}: quote {quoted / calls * 1e9:6.0f} ns  "
+            f"fast path {fast / calls * 1e9:6.0f} ns  ({quoted / fast:.1f}x)  "
+            f"route.path {built / calls * 1e9:6.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,59 @@
+"""Compare `react-router routes --json` through the package manager vs the local bin.
+
+Needs a real React Router project with dependencies installed:
+
+    uv run python -m benchmarks.subprocess_launch --directory ./frontend
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from react_router_routes.generate import (
+    detect_package_manager,
+    react_router_bin_command,
+    resolve_react_router_bin,
+)
+
+
+def _time_command(command: list[str], directory: Path, runs: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=directory, capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(
+    directory: Annotated[Path, typer.Option(help="React Router project directory")],
+    runs: Annotated[int, typer.Option(help="Invocations per launcher")] = 5,
+) -> None:
+    package_manager = detect_package_manager(directory)
+    commands = {
+        package_manager: [package_manager, "react-router", "routes", "--json"],
+    }
+
+    react_router_bin = resolve_react_router_bin(directory.resolve())
+    direct = react_router_bin and react_router_bin_command(react_router_bin)
+    if direct:
+        commands["direct"] = [*direct, "routes", "--json"]
+    else:
+        typer.echo("no local node_modules/.bin/react-router found", err=True)
+
+    for name, command in commands.items():
+        timings = _time_command(command, directory, runs)
+        typer.echo(
+            f"{name:>8}: median {statistics.median(timings) * 1000:7.0f} ms  "
+            f"min {min(timings) * 1000:7.0f} ms  ({' '.join(command)})"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
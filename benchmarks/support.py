@@ -0,0 +1,49 @@
+"""Shared helpers for building synthetic route trees and importing generated modules."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from react_router_routes.generate import collect_route_patterns, render_routes_module
+
+
+def synthetic_routes_json(count: int) -> list[dict]:
+    """Build a React Router routes tree with roughly `count` leaf routes.
+
+    Mixes static pages, required params, optional params and splats so the
+    generated module resembles a real application.
+    """
+    children: list[dict] = []
+    for i in range(count):
+        shape = i % 4
+        if shape == 0:
+            path = f"/section{i}/overview"
+        elif shape == 1:
+            path = f"/orgs/:orgId/section{i}/:itemId"
+        elif shape == 2:
+            path = f"/section{i}/:slug/:tab?"
+        else:
+            path = f"/files{i}/*"
+        children.append({"id": f"routes/{i}", "path": path, "file": f"routes/{i}.tsx"})
+
+    return [{"id": "root", "path": "", "file": "root.tsx", "children": children}]
+
+
+def load_generated_module(
+    routes_json: list[dict], directory: Path, module_name: str
+) -> ModuleType:
+    """Render a routes module into `directory` and import it (skips ruff to keep setup fast)."""
+    output = directory / f"{module_name}.py"
+    patterns = collect_route_patterns(routes_json)
+    output.write_text(render_routes_module(patterns))
+
+    spec = importlib.util.spec_from_file_location(module_name, output)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,93 @@
+"""Measure how generated-runtime throughput scales with thread count.
+
+On free-threaded builds (3.13t+) throughput should grow close to linearly with
+threads, since the runtime takes no locks. On GIL builds the numbers stay
+roughly flat, which shows the baseline rather than contention.
+
+    uv run python -m benchmarks.threaded_runtime --max-threads 8
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import typer
+
+from benchmarks.support import load_generated_module, synthetic_routes_json
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _run_threads(work, thread_count: int, calls_per_thread: int) -> float:
+    """Run `work(calls_per_thread)` on `thread_count` threads and return calls per second."""
+    barrier = threading.Barrier(thread_count + 1)
+
+    def target() -> None:
+        barrier.wait()
+        work(calls_per_thread)
+
+    threads = [threading.Thread(target=target) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return thread_count * calls_per_thread / elapsed
+
+
+def main(
+    max_threads: int = typer.Option(
+        os.cpu_count() or 4, help="Largest thread count to measure"
+    ),
+    calls_per_thread: int = typer.Option(50_000, help="Builder calls per thread"),
+    route_count: int = typer.Option(200, help="Synthetic routes in the module"),
+) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        routes = load_generated_module(
+            synthetic_routes_json(route_count), Path(tmp), "bench_threaded_routes"
+        )
+
+    pattern = "/orgs/:orgId/section1/:itemId"
+    route = routes.ROUTES_BY_PATTERN[pattern]
+
+    def by_pattern(calls: int) -> None:
+        for i in range(calls):
+            routes.react_router_url(
+                pattern, {"org_id": i, "item_id": "abc"}, base_url="https://x.test"
+            )
+
+    def by_route_object(calls: int) -> None:
+        for i in range(calls):
+            route.url(org_id=i, item_id="abc", base_url="https://x.test")
+
+    typer.echo(f"python {sys.version.split()[0]}, GIL enabled: {_gil_enabled()}")
+    for name, work in [
+        ("react_router_url", by_pattern),
+        ("Routes.*.url", by_route_object),
+    ]:
+        baseline = 0.0
+        thread_count = 1
+        while thread_count <= max_threads:
+            throughput = _run_threads(work, thread_count, calls_per_thread)
+            baseline = baseline or throughput
+            typer.echo(
+                f"{name:>18} threads={thread_count:<3} "
+                f"{throughput:>12,.0f} calls/s  speedup={throughput / baseline:.2f}x"
+            )
+            thread_count *= 2
+
+
+if __name__ == "__main__":
+    typer.run(main)
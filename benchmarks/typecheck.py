@@ -0,0 +1,91 @@
+"""Time pyright on synthetic route trees for each overload typing strategy.
+
+Each run type-checks a generated module plus a file of call sites, in an
+isolated project directory with its own pyrightconfig.json.
+
+    uv run python -m benchmarks.typecheck --counts 1000 --counts 5000 --counts 10000
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from benchmarks.support import synthetic_routes_json
+from react_router_routes.generate import (
+    TypingStrategy,
+    camel_to_snake,
+    collect_route_patterns,
+    parse_params,
+    render_routes_module,
+)
+
+DEFAULT_COUNTS = [1000, 5000, 10000]
+
+
+def _call_sites(patterns: list[str], calls: int) -> str:
+    """A module calling react_router_path with correctly-typed params for a spread of routes."""
+    lines = ["from routes_typing import react_router_path, react_router_url", ""]
+    step = max(1, len(patterns) // calls)
+    for pattern in patterns[::step][:calls]:
+        params, has_splat = parse_params(pattern)
+        snake_values = {
+            camel_to_snake(token): "x" for token, optional in params if not optional
+        }
+        if has_splat:
+            snake_values["splat"] = "x"
+        lines.append(f"react_router_path({pattern!r}, {snake_values!r})")
+        lines.append(f"react_router_url({pattern!r}, {snake_values!r})")
+    return "\n".join(lines) + "\n"
+
+
+def _time_pyright(pyright: str, project: Path) -> float:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [pyright, "--project", str(project)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+    assert result.returncode == 0, result.stdout
+    return elapsed
+
+
+def main(
+    counts: Annotated[list[int], typer.Option(help="Route counts")] = DEFAULT_COUNTS,
+    calls: Annotated[int, typer.Option(help="Call sites checked per tree")] = 200,
+    pyright: Annotated[str, typer.Option(help="pyright executable")] = "pyright",
+) -> None:
+    pyright_path = shutil.which(pyright)
+    assert pyright_path is not None, f"{pyright} not found; run via `uv run`"
+
+    for count in counts:
+        patterns = collect_route_patterns(synthetic_routes_json(count))
+        for strategy in TypingStrategy:
+            with tempfile.TemporaryDirectory() as tmp:
+                project = Path(tmp)
+                module = render_routes_module(patterns, typing_strategy=strategy)
+                (project / "routes_typing.py").write_text(module)
+                (project / "call_sites.py").write_text(_call_sites(patterns, calls))
+                (project / "pyrightconfig.json").write_text(
+                    json.dumps({"include": ["."], "pythonVersion": "3.11"})
+                )
+
+                elapsed = _time_pyright(pyright_path, project)
+
+            typer.echo(
+                f"routes={count:<6} typing={strategy.value:<9} "
+                f"overloads={module.count('@overload'):<6} pyright {elapsed:6.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -1,12 +1,15 @@
 """Package entrypoint for the react-router-routes CLI.
 
 Running the installed script (configured via [project.scripts]) will
-invoke Typer's CLI defined in `generate.py`.
+invoke Typer's CLI defined in `generate.py`, or one of the subcommands
+registered in `cli.py`.
 """
 
 from structlog_config import configure_logger
 
-from .generate import main as _main
+from .cli import main as _main
+from .snapshots import RouteSnapshotStore
+from .table import RouteTable, RouteTableHandle
 
 logger = configure_logger()
 
@@ -18,8 +21,9 @@ def main() -> None:  # console_scripts entry point
 
     Example:
         react-router-routes ./routes_typing.py --directory ./js-app
+        react-router-routes check-links ./urls.txt --json-file ./routes.json
     """
     _main()
 
 
-__all__ = ["main"]
+__all__ = ["RouteSnapshotStore", "RouteTable", "RouteTableHandle", "main"]
@@ -0,0 +1,40 @@
+"""Command line dispatch.
+
+`react-router-routes OUTPUT_FILE ...` keeps generating the routes module, as it
+always has. Extra tools live under named subcommands, which are routed here
+when the first argument is one of their names.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import typer
+
+from .generate import main as generate_main
+from .link_check import check_links
+from .warm import warm_cache
+
+subcommands = typer.Typer(
+    add_completion=False,
+    help="Additional react-router-routes tools. Run without a subcommand to generate the routes module.",
+)
+subcommands.command("check-links")(check_links)
+subcommands.command("warm-cache")(warm_cache)
+
+
+@subcommands.callback()
+def _subcommands_callback() -> None:
+    # an explicit callback keeps Typer in group mode even with a single command
+    pass
+
+
+def subcommand_names() -> set[str]:
+    return {command.name for command in subcommands.registered_commands if command.name}
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] in subcommand_names():
+        subcommands(prog_name="react-router-routes")
+    else:
+        generate_main()
@@ -1,9 +1,18 @@
+import functools
+import inspect
+import itertools
 import json
 import os
 import re
+import shutil
 import subprocess
+from collections.abc import Mapping
+from enum import Enum
 from importlib.metadata import version
 from pathlib import Path
+from typing import Annotated
+from urllib.parse import quote
+from uuid import UUID
 
 import typer
 from jinja2 import Environment
@@ -52,6 +61,40 @@ def _is_package_manager_available(manager: str) -> bool:
         return False
 
 
+@functools.cache
+def resolve_react_router_bin(directory: Path) -> Path | None:
+    """Find node_modules/.bin/react-router in directory or its nearest ancestor (monorepo roots).
+
+    Results are cached per directory; pass an absolute path so the cache key is stable.
+    """
+    for candidate_dir in [directory, *directory.parents]:
+        candidate = candidate_dir / "node_modules" / ".bin" / "react-router"
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def react_router_bin_command(react_router_bin: Path) -> list[str] | None:
+    """Command that runs a resolved react-router bin without a package manager launcher.
+
+    npm and bun link .bin entries to the JS entrypoint, which we hand straight to
+    node. pnpm and yarn write shell shims instead, which are executed as-is.
+    """
+    with react_router_bin.open("rb") as handle:
+        first_line = handle.readline(256)
+
+    is_node_script = react_router_bin.suffix in {".js", ".mjs", ".cjs"} or (
+        first_line.startswith(b"#!") and b"node" in first_line
+    )
+    if not is_node_script:
+        return [str(react_router_bin)]
+
+    node = shutil.which("node")
+    if node is None:
+        return None
+    return [node, str(react_router_bin)]
+
+
 def lint_generated_file(output_file: Path) -> None:
     """Automatically lint the generated file with ruff if available."""
     try:
@@ -151,6 +194,249 @@ def parse_params(pattern: str) -> tuple[list[tuple[str, bool]], bool]:
     return params, has_splat
 
 
+def expand_optional_segments(pattern: str) -> list[list[str]]:
+    """Expand a pattern into every segment list its optional segments allow.
+
+    "/users/:userId?" -> [["users", ":userId"], ["users"]]
+    """
+    choices: list[list[list[str]]] = []
+    for segment in pattern.strip("/").split("/"):
+        if not segment:
+            continue
+        if segment.endswith("?"):
+            choices.append([[segment[:-1]], []])
+        else:
+            choices.append([[segment]])
+
+    return [
+        [segment for chosen in combination for segment in chosen]
+        for combination in itertools.product(*choices)
+    ]
+
+
+def pattern_to_route_name(pattern: str) -> str:
+    """Name of the pre-bound route object for a pattern, e.g. "/users/:userId" -> "UsersUserId"."""
+    return pattern_to_class_name(pattern).removesuffix("Params")
+
+
+def unique_route_names(patterns: list[str]) -> dict[str, str]:
+    """Map each pattern to a route name, suffixing a counter when two patterns collapse to the same name."""
+    names: dict[str, str] = {}
+    taken: set[str] = set()
+    for pattern in patterns:
+        base = pattern_to_route_name(pattern)
+        # patterns such as "/404" produce names that are not valid identifiers
+        if not base.isidentifier():
+            base = f"Route{base}"
+        name = base
+        counter = 2
+        while name in taken:
+            name = f"{base}{counter}"
+            counter += 1
+        taken.add(name)
+        names[pattern] = name
+    return names
+
+
+# names a route object's path / url already use for their own arguments
+_ROUTE_METHOD_ARGUMENTS = frozenset({"self", "url_params", "base_url"})
+
+
+def route_keyword(name: str) -> str:
+    """Keyword for a snake_case param on a route object's path / url.
+
+    Params that clash with the methods' own arguments get a trailing
+    underscore, e.g. ":baseUrl" -> base_url_.
+    """
+    return f"{name}_" if name in _ROUTE_METHOD_ARGUMENTS else name
+
+
+def compile_pattern_parts(pattern: str) -> tuple[list[tuple[str, str, str]], str]:
+    """Split a pattern into ([(static_prefix, snake_param, kind)], static_tail).
+
+    kind is "required", "optional" or "splat". Static text between tokens is
+    pre-joined so a builder only has to concatenate prefixes and encoded values.
+    """
+    parts: list[tuple[str, str, str]] = []
+    position = 0
+    for m in re.finditer(r":([A-Za-z0-9_]+)(\?)?|\*", pattern):
+        static = pattern[position : m.start()]
+        if m.group(0) == "*":
+            parts.append((static, "splat", "splat"))
+        else:
+            kind = "optional" if m.group(2) is not None else "required"
+            parts.append((static, camel_to_snake(m.group(1)), kind))
+        position = m.end()
+    return parts, pattern[position:]
+
+
+# characters quote() never escapes; splats additionally keep "/". The generated
+# module, RouteTable and the SQL templates all encode with these.
+SAFE_PARAM_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~"
+)
+SAFE_SPLAT_CHARS = SAFE_PARAM_CHARS | {"/"}
+
+
+def encode_param(value: object) -> str:
+    """Percent-encode a param value, skipping quote() for ints, UUIDs and already-safe ASCII strings."""
+    if type(value) is int or type(value) is UUID:
+        return str(value)
+    if (
+        type(value) is str
+        and value.isascii()
+        and (value.isalnum() or SAFE_PARAM_CHARS.issuperset(value))
+    ):
+        return value
+    return quote(str(value), safe="")
+
+
+def encode_splat(value: object) -> str:
+    """Percent-encode a splat value, keeping "/" and skipping quote() when nothing needs escaping."""
+    if type(value) is str and value.isascii() and SAFE_SPLAT_CHARS.issuperset(value):
+        return value
+    return quote(str(value), safe="/")
+
+
+def _generated_encoders() -> str:
+    """Source of encode_param / encode_splat for the standalone generated module, as private names."""
+    source = inspect.getsource(encode_param) + "\n\n" + inspect.getsource(encode_splat)
+    return re.sub(r"\b(SAFE_\w+_CHARS|encode_param|encode_splat)\b", r"_\1", source)
+
+
+def compile_redirects(
+    redirects: Mapping[str, str | Mapping[str, object]], patterns: list[str]
+) -> list[tuple[str, str, dict[str, str]]]:
+    """Validate old -> new pattern redirects against the current route patterns.
+
+    Each value is either the new pattern, in which case params line up by
+    position, or {"to": new_pattern, "params": {new_token: old_token}}, where
+    unlisted params line up by name. Returns (old, new, {new_token: old_token})
+    and raises ValueError on targets that no longer exist or params that do not
+    line up, and TypeError when redirects is not shaped like that. Splats always
+    map to splats.
+    """
+    if not isinstance(redirects, Mapping):
+        raise TypeError("expected an object of old pattern -> redirect")
+
+    current = set(patterns)
+    compiled: list[tuple[str, str, dict[str, str]]] = []
+    for source, spec in redirects.items():
+        if isinstance(spec, str):
+            target = spec
+            explicit: Mapping[str, object] | None = None
+        elif isinstance(spec, Mapping):
+            target = spec.get("to")
+            explicit_params = spec.get("params", {})
+            if not isinstance(explicit_params, Mapping):
+                raise TypeError(
+                    f"params of the redirect for {source} must be an object"
+                )
+            explicit = explicit_params
+        else:
+            raise TypeError(
+                f"redirect for {source} must be a pattern or an object with a 'to' pattern"
+            )
+
+        if not isinstance(target, str) or target not in current:
+            raise ValueError(
+                f"redirect target {target!r} for {source} is not a current route"
+            )
+        if source in current:
+            raise ValueError(f"redirect source {source} is still a current route")
+
+        source_params, source_splat = parse_params(source)
+        target_params, target_splat = parse_params(target)
+        source_optional = dict(source_params)
+
+        if explicit is None:
+            if len(source_params) != len(target_params):
+                raise ValueError(
+                    f"redirect {source} -> {target} has {len(source_params)} params but the target takes {len(target_params)}"
+                )
+            param_map = {
+                new: old
+                for (new, _), (old, _) in zip(target_params, source_params, strict=True)
+            }
+        else:
+            param_map = {str(new): str(old) for new, old in explicit.items()}
+            for new, _ in target_params:
+                if new not in param_map and new in source_optional:
+                    param_map[new] = new
+
+        for new, new_optional in target_params:
+            old = param_map.get(new)
+            if old is None or old not in source_optional:
+                raise ValueError(
+                    f"redirect {source} -> {target} does not provide param {new}"
+                )
+            if source_optional[old] and not new_optional:
+                raise ValueError(
+                    f"redirect {source} -> {target} fills required param {new} from optional param {old}"
+                )
+        if target_splat and not source_splat:
+            raise ValueError(
+                f"redirect {source} -> {target} needs a splat in the source pattern"
+            )
+
+        compiled.append((source, target, param_map))
+    return compiled
+
+
+def build_redirect_trie(redirects: list[tuple[str, str, dict[str, str]]]) -> tuple:
+    """Index compiled redirects by segment for the generated react_router_redirect.
+
+    Nodes are (static children keyed by lowercased segment, param child, leaf
+    for a path ending here, leaf for a splat here). A leaf is (new pattern,
+    index into the captured old values for each of the new pattern's params,
+    None for an absent optional).
+    """
+
+    def new_node() -> list:
+        return [{}, None, None, None]
+
+    root = new_node()
+    for source, target, param_map in redirects:
+        target_parts, _ = compile_pattern_parts(target)
+        for segments in expand_optional_segments(source):
+            node = root
+            captured: list[str] = []
+            is_splat = False
+            for segment in segments:
+                if segment == "*":
+                    is_splat = True
+                    break
+                if segment.startswith(":"):
+                    captured.append(segment[1:])
+                    node[1] = node[1] or new_node()
+                    node = node[1]
+                    continue
+                node = node[0].setdefault(segment.lower(), new_node())
+            if is_splat:
+                captured.append("*")
+
+            tokens = [token for token, _ in parse_params(target)[0]]
+            indices: list[int | None] = []
+            for _, _, kind in target_parts:
+                old = "*" if kind == "splat" else param_map[tokens[len(indices)]]
+                indices.append(captured.index(old) if old in captured else None)
+
+            slot = 3 if is_splat else 2
+            if node[slot] is None:
+                node[slot] = (target, tuple(indices))
+
+    def freeze(node: list) -> tuple:
+        static, param, end, splat = node
+        return (
+            {key: freeze(child) for key, child in static.items()},
+            freeze(param) if param is not None else None,
+            end,
+            splat,
+        )
+
+    return freeze(root)
+
+
 JINJA_TEMPLATE = r'''
 """AUTOGENERATED FILE: Do not edit manually.
 Generated by react-router-routes from the React Router config.
@@ -159,16 +445,49 @@ Generated by react-router-routes from the React Router config.
 - Per-route TypedDicts define snake_case keys for params
 - react_router_path builds a path from a pattern and params
 - react_router_url prepends BASE_URL (env) or an explicit base_url
+- Routes holds a pre-bound route object per pattern, whose path / url take
+  the route's params as typed snake_case keywords (no lookups)
+- *_PATH constants expose routes without params as plain strings
+- RouteId is a stable integer per pattern (kept stable by the .route-ids.json
+  lockfile); route_ref / route_ref_path / route_ref_url encode and decode
+  compact (route id, *param values) references
+- PARAM_INDEX maps each snake_case param to the patterns that use it, and
+  expand_paths / expand_urls stream every URL fully determined by a set of
+  param bindings (e.g. for cache purges)
+- react_router_redirect maps URLs of renamed routes to their new path, when
+  the module was generated with --redirects
+- SQL_PATH_TEMPLATES / react_router_sql build the same paths inside Postgres
+  or SQLite queries, when the module was generated with --sql
+
+The runtime keeps no mutable shared state on the hot path: regexes are
+compiled once at import, ALIAS_MAP and the route objects are never mutated,
+and the only cache (missing BASE_URL warnings) is a dict written at most once
+per pattern. It is safe to call from many threads, including on free-threaded
+(no-GIL) CPython builds, without any locks.
 """
-from typing import Literal, overload, TypedDict, NotRequired
-from collections.abc import Mapping
+from typing import Final, Literal, overload, TypedDict, NotRequired
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from enum import IntEnum
 import re
-from urllib.parse import quote, urlencode
+from urllib.parse import quote, unquote, urlencode, urlsplit
+from uuid import UUID
 import os
 import logging
 
 logger = logging.getLogger("react_router_routes.generated")
 
+_OPTIONAL_TOKEN_RE = re.compile(r":([A-Za-z0-9_]+)\?")
+_REQUIRED_TOKEN_RE = re.compile(r":([A-Za-z0-9_]+)(?!\?)")
+_DUPLICATE_SLASHES_RE = re.compile(r"/{2,}")
+
+# characters quote() never escapes; splats additionally keep "/"
+_SAFE_PARAM_CHARS = frozenset({{ safe_param_chars }})
+_SAFE_SPLAT_CHARS = _SAFE_PARAM_CHARS | {"/"}
+
+# patterns that already logged a missing BASE_URL; dict reads are lock-free on
+# free-threaded builds and a racing duplicate write only repeats one warning
+_MISSING_BASE_URL_WARNED: dict[str, bool] = {}
+
 RoutePaths = Literal[{% for p in patterns %}{% if not loop.first %}, {% endif %}"{{ p }}"{% endfor %}]
 
 {% for r in routes if r.params or r.has_splat %}
@@ -191,7 +510,24 @@ ALIAS_MAP: dict[str, dict[str, str]] = {
 {% endfor %}
 }
 
+{{ encoders }}
+
+
 # overloads for path
+{% if typing_strategy == "grouped" %}
+{% for g in typing_groups %}
+@overload
+def react_router_path(path: Literal[{{ g.literals }}], params: {{ g.class_name }}, *, url_params: dict[str, str] | None = None) -> str: ...
+{% endfor %}
+{% if param_literals %}
+@overload
+def react_router_path(path: Literal[{{ param_literals }}], params: Mapping[str, object], *, url_params: dict[str, str] | None = None) -> str: ...
+{% endif %}
+{% if static_literals %}
+@overload
+def react_router_path(path: Literal[{{ static_literals }}], params: None | Mapping[str, object] = None, *, url_params: dict[str, str] | None = None) -> str: ...
+{% endif %}
+{% else %}
 {% for r in routes %}
 {% if r.params or r.has_splat %}
 @overload
@@ -203,6 +539,7 @@ def react_router_path(path: Literal["{{ r.pattern }}"], params: Mapping[str, obj
 def react_router_path(path: Literal["{{ r.pattern }}"], params: None | Mapping[str, object] = None, *, url_params: dict[str, str] | None = None) -> str: ...
 {% endif %}
 {% endfor %}
+{% endif %}
 @overload
 def react_router_path(path: RoutePaths, params: None | Mapping[str, object] = None, *, url_params: dict[str, str] | None = None) -> str: ...
 
@@ -227,23 +564,23 @@ def react_router_path(path: RoutePaths, params: Mapping[str, object] | None = No
     def _replace_optional(match: re.Match[str]) -> str:
         name = match.group(1)
         if name in values:
-            return quote(str(values[name]), safe="")
+            return _encode_param(values[name])
         return ""
 
-    rendered = re.sub(r":([A-Za-z0-9_]+)\?", _replace_optional, rendered)
+    rendered = _OPTIONAL_TOKEN_RE.sub(_replace_optional, rendered)
 
     def _replace_required(match: re.Match[str]) -> str:
         name = match.group(1)
         assert name in values, f"missing required param: {name}"
-        return quote(str(values[name]), safe="")
+        return _encode_param(values[name])
 
-    rendered = re.sub(r":([A-Za-z0-9_]+)(?!\?)", _replace_required, rendered)
+    rendered = _REQUIRED_TOKEN_RE.sub(_replace_required, rendered)
 
     if "*" in rendered:
         assert "splat" in values, "missing required param: splat"
-        rendered = rendered.replace("*", quote(str(values["splat"]), safe="/"))
+        rendered = rendered.replace("*", _encode_splat(values["splat"]))
 
-    rendered = re.sub(r"/{2,}", "/", rendered)
+    rendered = _DUPLICATE_SLASHES_RE.sub("/", rendered)
     if rendered != "/" and rendered.endswith("/"):
         rendered = rendered[:-1]
 
@@ -255,6 +592,20 @@ def react_router_path(path: RoutePaths, params: Mapping[str, object] | None = No
     return rendered
 
 # overloads for url
+{% if typing_strategy == "grouped" %}
+{% for g in typing_groups %}
+@overload
+def react_router_url(path: Literal[{{ g.literals }}], params: {{ g.class_name }}, *, base_url: str | None = None, url_params: dict[str, str] | None = None) -> str: ...
+{% endfor %}
+{% if param_literals %}
+@overload
+def react_router_url(path: Literal[{{ param_literals }}], params: Mapping[str, object], *, base_url: str | None = None, url_params: dict[str, str] | None = None) -> str: ...
+{% endif %}
+{% if static_literals %}
+@overload
+def react_router_url(path: Literal[{{ static_literals }}], params: None | Mapping[str, object] = None, *, base_url: str | None = None, url_params: dict[str, str] | None = None) -> str: ...
+{% endif %}
+{% else %}
 {% for r in routes %}
 {% if r.params or r.has_splat %}
 @overload
@@ -266,29 +617,403 @@ def react_router_url(path: Literal["{{ r.pattern }}"], params: Mapping[str, obje
 def react_router_url(path: Literal["{{ r.pattern }}"], params: None | Mapping[str, object] = None, *, base_url: str | None = None, url_params: dict[str, str] | None = None) -> str: ...
 {% endif %}
 {% endfor %}
+{% endif %}
 @overload
 def react_router_url(path: RoutePaths, params: None | Mapping[str, object] = None, *, base_url: str | None = None, url_params: dict[str, str] | None = None) -> str: ...
 
 def react_router_url(path: RoutePaths, params: Mapping[str, object] | None = None, *, base_url: str | None = None, url_params: dict[str, str] | None = None) -> str:
     """Build a full URL by prepending base_url or ENV BASE_URL to the path."""
     built = react_router_path(path, params, url_params=url_params)
+    return _prepend_base_url(path, built, base_url)
+
+
+def _prepend_base_url(path: str, built: str, base_url: str | None) -> str:
+    """Prepend base_url or ENV BASE_URL, warning once per pattern when neither is set."""
     base = base_url if base_url is not None else os.environ.get("BASE_URL")
     if not base:
-        logger.warning("BASE_URL missing; returning path only: %s", path)
+        if path not in _MISSING_BASE_URL_WARNED:
+            _MISSING_BASE_URL_WARNED[path] = True
+            logger.warning("BASE_URL missing; returning path only: %s", path)
         return built
 
     return base.rstrip("/") + built
+
+
+class _Route:
+    """A single route pattern with its static segments pre-joined.
+
+    Each pattern gets a subclass (shared by patterns with the same params)
+    whose path / url take the route's params as typed snake_case keywords,
+    which skips the ALIAS_MAP lookup and the params dict copy that
+    react_router_path does on every call.
+    """
+
+    __slots__ = ("pattern", "_parts", "_tail", "_required")
+
+    def __init__(self, pattern: str, parts: tuple[tuple[str, str, str], ...], tail: str) -> None:
+        self.pattern = pattern
+        self._parts = parts
+        self._tail = tail
+        self._required = frozenset(name for _, name, kind in parts if kind != "optional")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.pattern!r})"
+
+    def _render_values(self, values: Sequence[object]) -> str:
+        """Render from positional values in param order; None skips an optional param."""
+        assert len(values) == len(self._parts), f"expected {len(self._parts)} values for {self.pattern}"
+        chunks: list[str] = []
+        for (static, name, kind), value in zip(self._parts, values):
+            chunks.append(static)
+            if value is None:
+                assert kind == "optional", f"missing required param: {name}"
+                continue
+            if kind == "splat":
+                chunks.append(_encode_splat(value))
+            else:
+                chunks.append(_encode_param(value))
+        chunks.append(self._tail)
+        return _join_chunks(chunks)
+
+    def _path(self, values: Sequence[object], url_params: dict[str, str] | None) -> str:
+        rendered = self._render_values(values)
+        if url_params:
+            rendered += f"?{urlencode(url_params)}"
+        return rendered
+
+{% for c in route_classes %}
+
+class {{ c.class_name }}(_Route):
+    __slots__ = ()
+
+    def path(self, *, {% for p in c.params %}{{ p.name }}: object{% if p.optional %} = None{% endif %}, {% endfor %}url_params: dict[str, str] | None = None) -> str:
+        """Render this route's path{% if c.params | selectattr("optional") | list %}; optional params left as None are omitted{% endif %}."""
+        return self._path(({% for name in c.arguments %}{{ name }}, {% endfor %}), url_params)
+
+    def url(self, *, {% for p in c.params %}{{ p.name }}: object{% if p.optional %} = None{% endif %}, {% endfor %}base_url: str | None = None, url_params: dict[str, str] | None = None) -> str:
+        """Build a full URL for this route, prepending base_url or ENV BASE_URL."""
+        return _prepend_base_url(self.pattern, self._path(({% for name in c.arguments %}{{ name }}, {% endfor %}), url_params), base_url)
+{% endfor %}
+
+
+def _join_chunks(chunks: list[str]) -> str:
+    rendered = "".join(chunks)
+    if "//" in rendered:
+        rendered = _DUPLICATE_SLASHES_RE.sub("/", rendered)
+    if rendered != "/" and rendered.endswith("/"):
+        rendered = rendered[:-1]
+    return rendered
+
+
+class Routes:
+    """Namespace of pre-bound route objects, one per pattern."""
+
+    __slots__ = ()
+
+{% for r in routes %}
+    {{ r.route_name }}: Final = {{ r.route_class }}("{{ r.pattern }}", ({% for static, name, kind in r.parts %}("{{ static }}", "{{ name }}", "{{ kind }}"), {% endfor %}), "{{ r.tail }}")
+{% endfor %}
+
+
+ROUTES_BY_PATTERN: dict[str, _Route] = {
+{% for r in routes %}
+    "{{ r.pattern }}": Routes.{{ r.route_name }},
+{% endfor %}
+}
+
+{% for r in routes if not r.params and not r.has_splat %}
+{{ r.constant_name }}: Final = "{{ r.pattern }}"
+{% endfor %}
+
+
+# snake_case param name -> patterns using it (the inverse of ALIAS_MAP)
+PARAM_INDEX: dict[str, tuple[str, ...]] = {
+{% for name, param_patterns in param_index.items() %}
+    "{{ name }}": ({% for p in param_patterns %}"{{ p }}", {% endfor %}),
+{% endfor %}
+}
+
+
+def _expand(bindings: Iterable[Mapping[str, object]]) -> Iterator[tuple[_Route, str]]:
+    for binding in bindings:
+        seen: set[str] = set()
+        for name in binding:
+            for pattern in PARAM_INDEX.get(name, ()):
+                if pattern in seen:
+                    continue
+                seen.add(pattern)
+                route = ROUTES_BY_PATTERN[pattern]
+                # None leaves a param unbound, as in path(); skip rather than fail mid-stream
+                if all(binding.get(param) is not None for param in route._required):
+                    yield route, route._render_values([binding.get(param) for _, param, _ in route._parts])
+
+
+def expand_paths(bindings: Iterable[Mapping[str, object]]) -> Iterator[str]:
+    """Yield the path of every route fully determined by each {snake_case param: value} binding.
+
+    A None value counts as unbound. Only routes using at least one bound param are considered (via PARAM_INDEX), and
+    bindings are consumed lazily, so large purges stream without building lists.
+    """
+    for _, rendered in _expand(bindings):
+        yield rendered
+
+
+def expand_urls(bindings: Iterable[Mapping[str, object]], *, base_url: str | None = None) -> Iterator[str]:
+    """Like expand_paths, prepending base_url or ENV BASE_URL."""
+    for route, rendered in _expand(bindings):
+        yield _prepend_base_url(route.pattern, rendered, base_url)
+
+
+class RouteId(IntEnum):
+    """Stable integer id per route pattern, for compact storage and task payloads."""
+
+{% for r in routes %}
+    {{ r.id_name }} = {{ r.route_id }}
+{% endfor %}
+
+
+ROUTE_IDS: dict[str, RouteId] = {
+{% for r in routes %}
+    "{{ r.pattern }}": RouteId.{{ r.id_name }},
+{% endfor %}
+}
+
+# indexed by route id; None marks ids retired in the lockfile
+_ROUTES_BY_ID: tuple[_Route | None, ...] = ({% for route in routes_by_id %}{% if route %}Routes.{{ route.route_name }}{% else %}None{% endif %}, {% endfor %})
+
+
+def route_ref(path: RoutePaths, params: Mapping[str, object] | None = None) -> tuple[object, ...]:
+    """Encode a route as (route id, *param values in pattern order), with None for omitted optionals.
+
+    Accepts snake_case or original token keys (via ALIAS_MAP), and checks params
+    here so every ref decodes. The result is JSON-serializable when the values are.
+    """
+    route = ROUTES_BY_PATTERN[path]
+    names = {name for _, name, _ in route._parts}
+    snake_names = {token: snake for snake, token in ALIAS_MAP.get(path, {}).items()}
+    values: dict[str, object] = {}
+    for key, value in ({} if params is None else params).items():
+        values[snake_names.get(key, key)] = value
+    if not names.issuperset(values):
+        unexpected = sorted(set(values) - names)
+        raise TypeError(f"unexpected params for {path}: {', '.join(unexpected)}")
+
+    for _, name, kind in route._parts:
+        assert kind == "optional" or values.get(name) is not None, f"missing required param: {name}"
+    return (int(ROUTE_IDS[path]), *[values.get(name) for _, name, _ in route._parts])
+
+
+def _route_for_ref(ref: Sequence[object]) -> _Route:
+    route_id = ref[0]
+    assert isinstance(route_id, int), f"route id must be an int, got {route_id!r}"
+    route = _ROUTES_BY_ID[route_id] if 0 <= route_id < len(_ROUTES_BY_ID) else None
+    if route is None:
+        raise LookupError(f"unknown or retired route id: {route_id}")
+    return route
+
+
+def route_ref_path(ref: Sequence[object], *, url_params: dict[str, str] | None = None) -> str:
+    """Decode a route_ref back into a path without looking up the pattern string."""
+    rendered = _route_for_ref(ref)._render_values(ref[1:])
+    if url_params:
+        rendered += f"?{urlencode(url_params)}"
+    return rendered
+
+
+def route_ref_url(ref: Sequence[object], *, base_url: str | None = None, url_params: dict[str, str] | None = None) -> str:
+    """Decode a route_ref into a full URL, prepending base_url or ENV BASE_URL."""
+    route = _route_for_ref(ref)
+    return _prepend_base_url(route.pattern, route_ref_path(ref, url_params=url_params), base_url)
+{% if redirect_trie %}
+
+
+# old route patterns indexed by segment: (static children, param child, leaf, splat leaf);
+# leaves are (new pattern, index of the captured old value for each new param)
+_REDIRECT_TRIE: Final = {{ redirect_trie }}
+
+
+def _find_redirect(node: tuple, segments: list[str], index: int, values: list[str]) -> tuple[tuple, list[str]] | None:
+    static, param, leaf, splat_leaf = node
+    if index == len(segments):
+        if leaf is not None:
+            return leaf, values
+    else:
+        child = static.get(segments[index].lower())
+        if child is not None:
+            found = _find_redirect(child, segments, index + 1, values)
+            if found is not None:
+                return found
+        if param is not None:
+            found = _find_redirect(param, segments, index + 1, [*values, unquote(segments[index])])
+            if found is not None:
+                return found
+    if splat_leaf is not None:
+        return splat_leaf, [*values, unquote("/".join(segments[index:]))]
+    return None
+
+
+def react_router_redirect(url: str) -> str | None:
+    """Return the new path for a URL matching a redirected old pattern, or None.
+
+    Accepts a path or an absolute URL (the result is always a path). Lookup
+    walks the URL's segments once, so its cost does not grow with the number
+    of redirects. The query string is carried over unchanged.
+    """
+    parts = urlsplit(url.strip())
+    query = parts.query
+    segments = [segment for segment in parts.path.split("/") if segment]
+    found = _find_redirect(_REDIRECT_TRIE, segments, 0, [])
+    if found is None:
+        return None
+
+    (target, indices), values = found
+    rendered = ROUTES_BY_PATTERN[target]._render_values([None if i is None else values[i] for i in indices])
+    return f"{rendered}?{query}" if query else rendered
+{% endif %}
+{% if sql_templates %}
+
+
+# pattern -> dialect -> SQL expression computing the path, with {snake_param} placeholders
+SQL_PATH_TEMPLATES: Final[dict[str, dict[str, str]]] = {
+{% for pattern, by_dialect in sql_templates.items() %}
+    "{{ pattern }}": {
+{% for dialect, sql in by_dialect.items() %}
+        "{{ dialect }}": {{ sql }},
+{% endfor %}
+    },
+{% endfor %}
+}
+
+
+def react_router_sql(path: RoutePaths, columns: Mapping[str, str] | None = None, *, dialect: Literal["postgresql", "sqlite"] = "postgresql", base_url: str | None = None) -> str:
+    """SQL expression computing react_router_path (or, with base_url, the URL) for each row.
+
+    columns maps snake_case params to column expressions. Optional params can
+    be left out, and a NULL optional value omits it for that row; a NULL
+    required value makes the result NULL. Encoding matches react_router_path
+    for text, integer and uuid columns.
+    """
+    route = ROUTES_BY_PATTERN[path]
+    values = {} if columns is None else columns
+    names = {name for _, name, _ in route._parts}
+    if not names.issuperset(values):
+        unexpected = sorted(set(values) - names)
+        raise TypeError(f"unexpected params for {path}: {', '.join(unexpected)}")
+
+    sql_values: dict[str, str] = {}
+    for _, name, kind in route._parts:
+        if name in values:
+            sql_values[name] = f"({values[name]})"
+            continue
+        assert kind == "optional", f"missing required param: {name}"
+        sql_values[name] = "NULL"
+
+    expression = SQL_PATH_TEMPLATES[path][dialect].format_map(sql_values)
+    if base_url:
+        literal = base_url.rstrip("/").replace("'", "''")
+        return f"'{literal}' || {expression}"
+    return expression
+{% endif %}
 '''
 
 
-def render_routes_module(patterns: list[str]) -> str:
+class TypingStrategy(str, Enum):
+    """How react_router_path / react_router_url overloads are emitted.
+
+    overloads: two overloads per route (the default).
+    grouped: one overload per distinct params shape, with a Literal union of
+    every pattern sharing it. Same TypedDict checking, but the overload count
+    tracks the number of shapes instead of the number of routes, which keeps
+    pyright and mypy fast on large route trees.
+    """
+
+    overloads = "overloads"
+    grouped = "grouped"
+
+
+def _literal_union(patterns: list[str]) -> str:
+    return ", ".join(f'"{pattern}"' for pattern in patterns)
+
+
+def group_routes_by_params_shape(routes: list[dict]) -> list[dict]:
+    """Group routes with params by (params, optionality, splat), keeping first-seen order."""
+    groups: dict[tuple, dict] = {}
+    for route in routes:
+        if not route["params"] and not route["has_splat"]:
+            continue
+        shape = (
+            tuple((p["snake"], p["optional"]) for p in route["params"]),
+            route["has_splat"],
+        )
+        group = groups.setdefault(
+            shape, {"class_name": route["class_name"], "patterns": []}
+        )
+        group["patterns"].append(route["pattern"])
+
+    return [
+        {
+            "class_name": group["class_name"],
+            "literals": _literal_union(group["patterns"]),
+        }
+        for group in groups.values()
+    ]
+
+
+def route_ids_file(output_file: Path) -> Path:
+    """Lockfile next to the generated module that keeps RouteId values stable."""
+    return output_file.with_name(f"{output_file.stem}.route-ids.json")
+
+
+def assign_route_ids(patterns: list[str], existing: dict[str, int]) -> dict[str, int]:
+    """Keep ids already in the lockfile and give new patterns the next unused id.
+
+    Patterns that disappeared keep their id in the result so it is never reused.
+    """
+    route_ids = dict(existing)
+    next_id = max(route_ids.values(), default=0) + 1
+    for pattern in patterns:
+        if pattern not in route_ids:
+            route_ids[pattern] = next_id
+            next_id += 1
+    return route_ids
+
+
+def read_route_ids(lockfile: Path) -> dict[str, int]:
+    if not lockfile.exists():
+        return {}
+    return json.loads(lockfile.read_text())["routes"]
+
+
+def write_route_ids(lockfile: Path, route_ids: dict[str, int]) -> None:
+    ordered = dict(sorted(route_ids.items(), key=lambda item: item[1]))
+    lockfile.write_text(json.dumps({"version": 1, "routes": ordered}, indent=2) + "\n")
+
+
+def render_routes_module(
+    patterns: list[str],
+    route_ids: dict[str, int] | None = None,
+    redirects: Mapping[str, str | Mapping[str, object]] | None = None,
+    typing_strategy: TypingStrategy = TypingStrategy.overloads,
+    sql: bool = False,
+) -> str:
+    if route_ids is None:
+        route_ids = assign_route_ids(patterns, {})
+
     # Build context for Jinja
     routes = []
+    route_names = unique_route_names(patterns)
     for pattern in patterns:
         params, has_splat = parse_params(pattern)
+        parts, tail = compile_pattern_parts(pattern)
         route = {
             "pattern": pattern,
             "class_name": pattern_to_class_name(pattern),
+            "route_name": route_names[pattern],
+            "constant_name": f"{camel_to_snake(route_names[pattern]).upper()}_PATH",
+            "id_name": camel_to_snake(route_names[pattern]).upper(),
+            "route_id": route_ids[pattern],
+            "parts": parts,
+            "tail": tail,
             "has_splat": has_splat,
             "params": [
                 {
@@ -302,9 +1027,134 @@ def render_routes_module(patterns: list[str]) -> str:
         }
         routes.append(route)
 
+    param_index: dict[str, list[str]] = {}
+    for route in routes:
+        for snake in route["alias_map"]:
+            param_index.setdefault(snake, []).append(route["pattern"])
+
+    redirect_trie = None
+    if redirects:
+        redirect_trie = build_redirect_trie(compile_redirects(redirects, patterns))
+
+    routes_by_id: list[dict | None] = [None] * (max(route_ids.values(), default=0) + 1)
+    for route in routes:
+        routes_by_id[route["route_id"]] = route
+
+    # one route object class per distinct (param, kind) sequence
+    route_classes: dict[tuple, dict] = {}
+    for route in routes:
+        shape = tuple((name, kind) for _, name, kind in route["parts"])
+        signature: dict[str, bool] = {}
+        for name, kind in shape:
+            # a param repeated in the pattern is one keyword, optional only if every use is
+            keyword_name = route_keyword(name)
+            optional = signature.get(keyword_name, True) and kind == "optional"
+            signature[keyword_name] = optional
+        class_name = f"_{route['route_name']}Route" if shape else "_StaticRoute"
+        route_class = route_classes.setdefault(
+            shape,
+            {
+                "class_name": class_name,
+                "params": [
+                    {"name": name, "optional": optional}
+                    for name, optional in signature.items()
+                ],
+                "arguments": [route_keyword(name) for name, _ in shape],
+            },
+        )
+        route["route_class"] = route_class["class_name"]
+
+    sql_templates = None
+    if sql:
+        # imported here: the sql module builds on this one's pattern helpers
+        from .sql import sql_path_templates
+
+        sql_templates = {
+            pattern: {dialect: repr(sql) for dialect, sql in by_dialect.items()}
+            for pattern, by_dialect in sql_path_templates(patterns).items()
+        }
+
     env = Environment()
     template = env.from_string(JINJA_TEMPLATE)
-    return template.render(patterns=patterns, routes=routes) + "\n"
+    return (
+        template.render(
+            patterns=patterns,
+            routes=routes,
+            routes_by_id=routes_by_id,
+            route_classes=list(route_classes.values()),
+            safe_param_chars=repr("".join(sorted(SAFE_PARAM_CHARS))),
+            encoders=_generated_encoders(),
+            param_index=param_index,
+            redirect_trie=repr(redirect_trie) if redirect_trie else None,
+            sql_templates=sql_templates,
+            typing_strategy=typing_strategy.value,
+            typing_groups=group_routes_by_params_shape(routes),
+            param_literals=_literal_union(
+                [r["pattern"] for r in routes if r["params"] or r["has_splat"]]
+            ),
+            static_literals=_literal_union(
+                [r["pattern"] for r in routes if not r["params"] and not r["has_splat"]]
+            ),
+        )
+        + "\n"
+    )
+
+
+def load_routes_json(
+    directory: Path | None, json_file: Path | None, direct: bool = True
+) -> list[dict]:
+    """Read routes JSON from json_file, or run `react-router routes --json` in directory.
+
+    json_file wins when both are supplied; directory defaults to the current directory.
+    With direct, a local node_modules/.bin/react-router is run without going through
+    the package manager, falling back to the package manager when none is installed.
+    """
+    if json_file is not None:
+        routes_json = json.loads(json_file.read_text())
+    else:
+        if directory is None:
+            directory = Path.cwd()
+            log.info("using default directory", directory=directory)
+
+        react_router_command: list[str] | None = None
+        if direct:
+            react_router_bin = resolve_react_router_bin(directory.resolve())
+            if react_router_bin is not None:
+                react_router_command = react_router_bin_command(react_router_bin)
+
+        if react_router_command is not None:
+            package_manager = "node"
+            typer.echo(
+                f"Using local react-router: {react_router_command[-1]}", err=True
+            )
+        else:
+            # Detect and use appropriate package manager
+            package_manager = detect_package_manager(directory)
+            typer.echo(f"Using package manager: {package_manager}", err=True)
+            react_router_command = [package_manager, "react-router"]
+
+        result = subprocess.run(
+            [*react_router_command, "routes", "--json"],
+            cwd=directory,
+            capture_output=True,
+            text=True,
+        )
+
+        if result.returncode != 0:
+            command = " ".join(str(arg) for arg in result.args)
+            log.debug(
+                "react-router command failed",
+                package_manager=package_manager,
+                command=command,
+                exit_code=result.returncode,
+                stdout=result.stdout or "",
+                stderr=result.stderr or "",
+            )
+            typer.echo(f"Error running react-router with {package_manager}", err=True)
+            raise typer.Exit(1)
+        routes_json = json.loads(result.stdout)
+
+    return routes_json
 
 
 def generate_route_types(
@@ -323,6 +1173,50 @@ def generate_route_types(
         "-j",
         help="Path to an existing react-router routes JSON file (skips package manager detection)",
     ),
+    # Annotated keeps real Python defaults, so direct calls (as in tests) can omit these
+    redirects_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--redirects",
+            "-r",
+            help='JSON object of old pattern -> new pattern (or {"to": ..., "params": {new: old}}) to compile into react_router_redirect',
+        ),
+    ] = None,
+    typing_strategy: Annotated[
+        TypingStrategy,
+        typer.Option(
+            "--typing",
+            help="overloads: two overloads per route. grouped: one overload per params shape, much cheaper for type checkers on large route trees",
+        ),
+    ] = TypingStrategy.overloads,
+    sql: Annotated[
+        bool,
+        typer.Option(
+            "--sql",
+            help="Also emit SQL_PATH_TEMPLATES and react_router_sql, to build URLs inside Postgres or SQLite queries",
+        ),
+    ] = False,
+    snapshot_store: Annotated[
+        Path | None,
+        typer.Option(
+            "--snapshot-store",
+            help="Record this run's route patterns in a versioned snapshot store (created if missing), for matching links from older releases",
+        ),
+    ] = None,
+    snapshot_version: Annotated[
+        str | None,
+        typer.Option(
+            "--snapshot-version",
+            help="Release name to record the snapshot under; re-recording a release replaces it",
+        ),
+    ] = None,
+    direct: Annotated[
+        bool,
+        typer.Option(
+            "--direct/--no-direct",
+            help="Run the project's node_modules/.bin/react-router directly instead of through the package manager, when it is installed",
+        ),
+    ] = True,
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -341,6 +1235,8 @@ def generate_route_types(
     """Generate Python route typings and helpers from React Router routes.
 
     You must supply either --json-file or --directory. If both are supplied, --json-file wins.
+
+    Other tools: react-router-routes check-links --help, react-router-routes warm-cache --help
     """
 
     if verbose:
@@ -348,45 +1244,50 @@ def generate_route_types(
         global log
         log = configure_logger()
 
-    if json_file is not None:
-        routes_json = json.loads(json_file.read_text())
-    else:
-        if directory is None:
-            directory = Path.cwd()
-            log.info("using default directory", directory=directory)
+    # check flags before any work, so a bad invocation writes nothing
+    if snapshot_store is not None and not snapshot_version:
+        typer.echo("--snapshot-store needs --snapshot-version", err=True)
+        raise typer.Exit(1)
+    if snapshot_version and snapshot_store is None:
+        typer.echo("--snapshot-version needs --snapshot-store", err=True)
+        raise typer.Exit(1)
 
-        # Detect and use appropriate package manager
-        package_manager = detect_package_manager(directory)
-        typer.echo(f"Using package manager: {package_manager}")
+    routes_json = load_routes_json(directory, json_file, direct)
 
-        result = subprocess.run(
-            [package_manager, "react-router", "routes", "--json"],
-            cwd=directory,
-            capture_output=True,
-            text=True,
-        )
+    patterns = collect_route_patterns(routes_json)
 
-        if result.returncode != 0:
-            command = " ".join(str(arg) for arg in result.args)
-            log.debug(
-                "react-router command failed",
-                package_manager=package_manager,
-                command=command,
-                exit_code=result.returncode,
-                stdout=result.stdout or "",
-                stderr=result.stderr or "",
-            )
-            typer.echo(f"Error running react-router with {package_manager}")
-            raise typer.Exit(1)
-        routes_json = json.loads(result.stdout)
+    lockfile = route_ids_file(output_file)
+    route_ids = assign_route_ids(patterns, read_route_ids(lockfile))
 
-    patterns = collect_route_patterns(routes_json)
-    content = render_routes_module(patterns)
+    try:
+        # a JSONDecodeError is a ValueError, so it is reported the same way
+        redirects = json.loads(redirects_file.read_text()) if redirects_file else None
+        content = render_routes_module(
+            patterns, route_ids, redirects, typing_strategy, sql=sql
+        )
+    except (TypeError, ValueError) as error:
+        typer.echo(f"Invalid redirects: {error}", err=True)
+        raise typer.Exit(1)
+    # only once the module renders, so a failed run leaves the lockfile untouched
+    write_route_ids(lockfile, route_ids)
     output_file.write_text(content)
 
     # Automatically lint the generated file with ruff if available
     lint_generated_file(output_file)
 
+    if snapshot_store is not None and snapshot_version:
+        # imported here: the snapshot store builds on the matcher, which imports this module
+        from .snapshots import RouteSnapshotStore
+
+        store = RouteSnapshotStore.load(snapshot_store)
+        store.add(snapshot_version, patterns)
+        store.save(snapshot_store)
+        log.info(
+            "recorded route snapshot",
+            release=snapshot_version,
+            releases=len(store),
+        )
+
     try:
         relative_output = output_file.relative_to(Path.cwd())
     except ValueError:
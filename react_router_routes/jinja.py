@@ -0,0 +1,144 @@
+"""Jinja extension adding `route_path` / `route_url` tags backed by a generated routes module.
+
+    env = Environment(extensions=[RoutesExtension])
+    env.react_router_routes = routes_typing  # the module written by react-router-routes
+    env.react_router_base_url = "https://example.com"  # optional default for route_url
+
+    {% route_path "/users/:userId", user_id=user.id %}
+    {% route_url "/settings", url_params={"tab": "billing"} %}
+
+Patterns and param names are checked against the generated module when the
+template is compiled, so a typo fails at load time rather than on render.
+Calls whose params are all literals are rendered once at compile time and
+emitted as plain text; the rest call the route's pre-bound builder directly,
+skipping react_router_path's alias lookup.
+
+Folded links are baked into the compiled template, so create a new
+Environment after regenerating the routes module.
+"""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+from jinja2 import Environment, nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+
+from .generate import route_keyword
+
+
+class RoutesExtension(Extension):
+    # jinja2 types Extension.tags as a set
+    tags = {"route_path", "route_url"}  # noqa: RUF012
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        environment.extend(react_router_routes=None, react_router_base_url=None)
+
+    @property
+    def _routes_module(self) -> ModuleType | None:
+        return getattr(self.environment, "react_router_routes", None)
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        token = next(parser.stream)
+        tag = token.value
+        lineno = token.lineno
+
+        routes_module = self._routes_module
+        if routes_module is None:
+            parser.fail(
+                f"{tag} needs environment.react_router_routes set to the generated routes module",
+                lineno,
+            )
+
+        pattern_node = parser.parse_expression()
+        if not isinstance(pattern_node, nodes.Const) or not isinstance(
+            pattern_node.value, str
+        ):
+            parser.fail(f"{tag} needs a string literal route pattern", lineno)
+        pattern = pattern_node.value
+
+        route = routes_module.ROUTES_BY_PATTERN.get(pattern)
+        if route is None:
+            parser.fail(f"unknown route pattern: {pattern}", lineno)
+
+        keywords: list[nodes.Keyword] = []
+        while parser.stream.current.type != "block_end":
+            parser.stream.expect("comma")
+            name = parser.stream.expect("name")
+            if any(keyword.key == name.value for keyword in keywords):
+                parser.fail(f"duplicate param: {name.value}", name.lineno)
+            parser.stream.expect("assign")
+            keywords.append(
+                nodes.Keyword(name.value, parser.parse_expression(), lineno=name.lineno)
+            )
+
+        options = {"url_params", "base_url"} if tag == "route_url" else {"url_params"}
+        param_names = {name for _, name, _ in route._parts}
+        given = {keyword.key for keyword in keywords}
+        unexpected = sorted(given - param_names - options)
+        if unexpected:
+            parser.fail(
+                f"unexpected params for {pattern}: {', '.join(unexpected)}", lineno
+            )
+        missing = sorted(route._required - given)
+        if missing:
+            parser.fail(f"missing required param: {', '.join(missing)}", lineno)
+
+        # route objects take params that clash with their own arguments as name_
+        for keyword in keywords:
+            if keyword.key in param_names and keyword.key not in options:
+                keyword.key = route_keyword(keyword.key)
+
+        base_url = getattr(self.environment, "react_router_base_url", None)
+        if tag == "route_url" and base_url and "base_url" not in given:
+            keywords.append(
+                nodes.Keyword("base_url", nodes.Const(base_url), lineno=lineno)
+            )
+
+        try:
+            folded = self._fold(tag, route, keywords)
+        except (AssertionError, TypeError) as error:
+            # a literal the route rejects, e.g. user_id=none for a required param
+            parser.fail(str(error), lineno)
+        if folded is not None:
+            return nodes.Output([nodes.Const(folded)], lineno=lineno)
+
+        method = "_route_url" if tag == "route_url" else "_route_path"
+        call = nodes.Call(
+            self.attr(method, lineno=lineno),
+            [nodes.Const(pattern)],
+            keywords,
+            None,
+            None,
+            lineno=lineno,
+        )
+        return nodes.Output([call], lineno=lineno)
+
+    def _fold(self, tag: str, route, keywords: list[nodes.Keyword]) -> str | None:
+        """Render the link now when every argument is a literal, else None."""
+        eval_ctx = nodes.EvalContext(self.environment)
+        try:
+            kwargs = {
+                keyword.key: keyword.value.as_const(eval_ctx) for keyword in keywords
+            }
+        except nodes.Impossible:
+            return None
+
+        if tag == "route_path":
+            return route.path(**kwargs)
+        # without an explicit base_url the URL depends on BASE_URL at render time
+        if not kwargs.get("base_url"):
+            return None
+        return route.url(**kwargs)
+
+    def _route_path(self, pattern: str, **params: object) -> str:
+        routes_module = self._routes_module
+        assert routes_module is not None
+        return routes_module.ROUTES_BY_PATTERN[pattern].path(**params)
+
+    def _route_url(self, pattern: str, **params: object) -> str:
+        routes_module = self._routes_module
+        assert routes_module is not None
+        return routes_module.ROUTES_BY_PATTERN[pattern].url(**params)
@@ -0,0 +1,226 @@
+"""Bulk-check a file of URLs against the current route table.
+
+The URL file is memory-mapped and split into newline-aligned byte ranges.
+Each range is matched in a worker process that builds its own RouteMatcher
+once, and results are written as JSONL in input order while later ranges are
+still being processed.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Annotated, TextIO
+
+import typer
+
+from .generate import collect_route_patterns, load_routes_json
+from .matcher import RouteMatcher
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# set once per worker process by _init_worker
+_worker_matcher: RouteMatcher | None = None
+
+
+def iter_line_chunks(urls_file: Path, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) byte ranges of roughly chunk_size that end on a newline."""
+    size = urls_file.stat().st_size
+    if size == 0:
+        return
+
+    with (
+        urls_file.open("rb") as handle,
+        mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                newline = mapped.find(b"\n", end - 1)
+                end = size if newline == -1 else newline + 1
+            yield start, end
+            start = end
+
+
+def check_chunk(
+    matcher: RouteMatcher, urls_file: Path, start: int, end: int, dead_only: bool
+) -> tuple[str, int, int]:
+    """Classify the URLs in one byte range, returning (jsonl, matched, dead)."""
+    with (
+        urls_file.open("rb") as handle,
+        mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        data = mapped[start:end]
+
+    lines: list[str] = []
+    matched = 0
+    dead = 0
+    for raw in data.splitlines():
+        url = raw.decode("utf-8", errors="replace").strip()
+        if not url:
+            continue
+
+        found = matcher.match(url)
+        if found is None:
+            dead += 1
+            lines.append(json.dumps({"url": url, "status": "dead"}))
+            continue
+
+        matched += 1
+        if not dead_only:
+            lines.append(
+                json.dumps(
+                    {
+                        "url": url,
+                        "status": "matched",
+                        "pattern": found.pattern,
+                        "params": found.params,
+                    }
+                )
+            )
+
+    jsonl = "".join(f"{line}\n" for line in lines)
+    return jsonl, matched, dead
+
+
+def _init_worker(patterns: list[str]) -> None:
+    global _worker_matcher
+    _worker_matcher = RouteMatcher(patterns)
+
+
+def _check_chunk_in_worker(
+    urls_file: Path, start: int, end: int, dead_only: bool
+) -> tuple[str, int, int]:
+    assert _worker_matcher is not None, "worker initializer did not run"
+    return check_chunk(_worker_matcher, urls_file, start, end, dead_only)
+
+
+def check_links_file(
+    patterns: list[str],
+    urls_file: Path,
+    out: TextIO,
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dead_only: bool = False,
+) -> tuple[int, int]:
+    """Stream JSONL results for every URL in urls_file to out; return (matched, dead).
+
+    With workers > 1 chunks are processed in a process pool, keeping at most
+    two chunks per worker in flight so memory stays bounded on huge inputs.
+    """
+    matched_total = 0
+    dead_total = 0
+    chunks = iter_line_chunks(urls_file, chunk_size)
+
+    if workers <= 1:
+        matcher = RouteMatcher(patterns)
+        for start, end in chunks:
+            jsonl, matched, dead = check_chunk(
+                matcher, urls_file, start, end, dead_only
+            )
+            out.write(jsonl)
+            matched_total += matched
+            dead_total += dead
+        return matched_total, dead_total
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(patterns,)
+    ) as executor:
+        pending: deque[Future[tuple[str, int, int]]] = deque()
+        for start, end in chunks:
+            pending.append(
+                executor.submit(
+                    _check_chunk_in_worker, urls_file, start, end, dead_only
+                )
+            )
+            if len(pending) < workers * 2:
+                continue
+
+            jsonl, matched, dead = pending.popleft().result()
+            out.write(jsonl)
+            matched_total += matched
+            dead_total += dead
+
+        while pending:
+            jsonl, matched, dead = pending.popleft().result()
+            out.write(jsonl)
+            matched_total += matched
+            dead_total += dead
+
+    return matched_total, dead_total
+
+
+def check_links(
+    urls_file: Annotated[
+        Path, typer.Argument(help="Newline-delimited file of URLs or paths to check")
+    ],
+    directory: Annotated[
+        Path | None,
+        typer.Option(
+            "--directory",
+            "-d",
+            help="Path to React Router project directory (auto-detects package manager: bun, pnpm, or npm)",
+        ),
+    ] = None,
+    json_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--json-file",
+            "-j",
+            help="Path to an existing react-router routes JSON file (skips package manager detection)",
+        ),
+    ] = None,
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output", "-o", help="Write JSONL results to this file instead of stdout"
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", help="Worker processes (1 checks in-process)"),
+    ] = os.cpu_count() or 1,
+    chunk_size: Annotated[
+        int,
+        typer.Option(
+            "--chunk-size",
+            help="Approximate bytes of the URL file handled per work unit",
+        ),
+    ] = DEFAULT_CHUNK_SIZE,
+    dead_only: Annotated[
+        bool,
+        typer.Option("--dead-only", help="Only emit URLs that do not match any route"),
+    ] = False,
+):
+    """Classify every URL in a file as matched (with its pattern) or dead, as JSONL."""
+    patterns = collect_route_patterns(load_routes_json(directory, json_file))
+
+    if output is None:
+        matched, dead = check_links_file(
+            patterns,
+            urls_file,
+            sys.stdout,
+            workers=workers,
+            chunk_size=chunk_size,
+            dead_only=dead_only,
+        )
+    else:
+        with output.open("w") as out:
+            matched, dead = check_links_file(
+                patterns,
+                urls_file,
+                out,
+                workers=workers,
+                chunk_size=chunk_size,
+                dead_only=dead_only,
+            )
+
+    typer.echo(f"Checked {matched + dead} links: {dead} dead", err=True)
@@ -0,0 +1,115 @@
+"""Match URLs against React Router patterns using a segment trie.
+
+Patterns are split on "/" and inserted into a trie once; matching walks the
+URL's segments, preferring static segments over dynamic ones and dynamic ones
+over splats (the same ranking React Router uses), so lookup cost depends on
+URL depth rather than on the number of routes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+from urllib.parse import unquote, urlsplit
+
+from .generate import camel_to_snake, expand_optional_segments
+
+
+class RouteMatch(NamedTuple):
+    pattern: str
+    # snake_case param names, matching the keys accepted by the generated builders
+    params: dict[str, str]
+
+
+class _Node:
+    __slots__ = ("dynamic", "splats", "static", "terminals")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node] = {}
+        self.dynamic: _Node | None = None
+        # (pattern, param names in segment order) for patterns ending here
+        self.terminals: list[tuple[str, tuple[str, ...]]] = []
+        self.splats: list[tuple[str, tuple[str, ...]]] = []
+
+
+def url_path_segments(url: str) -> list[str]:
+    """Split the path of a URL (absolute or relative) into non-empty segments."""
+    path = urlsplit(url.strip()).path
+    return [segment for segment in path.split("/") if segment]
+
+
+class RouteMatcher:
+    """Compiled matcher over a list of route patterns.
+
+    Static segments compare case-insensitively by default, like React Router.
+    When two patterns match with the same rank, the one listed first wins.
+    """
+
+    __slots__ = ("_case_sensitive", "_root")
+
+    def __init__(self, patterns: Iterable[str], *, case_sensitive: bool = False):
+        self._root = _Node()
+        self._case_sensitive = case_sensitive
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> None:
+        for segments in expand_optional_segments(pattern):
+            node = self._root
+            names: list[str] = []
+            is_splat = False
+            for segment in segments:
+                if segment == "*":
+                    is_splat = True
+                    break
+                if segment.startswith(":"):
+                    names.append(camel_to_snake(segment[1:]))
+                    if node.dynamic is None:
+                        node.dynamic = _Node()
+                    node = node.dynamic
+                    continue
+                key = segment if self._case_sensitive else segment.lower()
+                node = node.static.setdefault(key, _Node())
+
+            target = node.splats if is_splat else node.terminals
+            target.append((pattern, tuple(names)))
+
+    def match(self, url: str) -> RouteMatch | None:
+        """Return the best-ranked pattern matching url, or None when it is dead."""
+        for found in self._walk(self._root, url_path_segments(url), 0, []):
+            return found
+        return None
+
+    def match_all(self, url: str) -> list[RouteMatch]:
+        """Return every pattern matching url, best-ranked first (each pattern once)."""
+        matches: dict[str, RouteMatch] = {}
+        for found in self._walk(self._root, url_path_segments(url), 0, []):
+            matches.setdefault(found.pattern, found)
+        return list(matches.values())
+
+    def _walk(
+        self, node: _Node, segments: list[str], index: int, values: list[str]
+    ) -> Iterator[RouteMatch]:
+        if index == len(segments):
+            for pattern, names in node.terminals:
+                yield RouteMatch(pattern, _params(names, values))
+        else:
+            segment = segments[index]
+            key = segment if self._case_sensitive else segment.lower()
+            child = node.static.get(key)
+            if child is not None:
+                yield from self._walk(child, segments, index + 1, values)
+
+            if node.dynamic is not None:
+                values.append(unquote(segment))
+                yield from self._walk(node.dynamic, segments, index + 1, values)
+                values.pop()
+
+        for pattern, names in node.splats:
+            params = _params(names, values)
+            params["splat"] = unquote("/".join(segments[index:]))
+            yield RouteMatch(pattern, params)
+
+
+def _params(names: tuple[str, ...], values: list[str]) -> dict[str, str]:
+    return dict(zip(names, values, strict=True))
@@ -0,0 +1,262 @@
+"""Pytest plugin that generates the routes module once and shares it across tests.
+
+Opt-in, so installing the package does not touch other projects' test runs:
+enable it with `-p react_router_routes.pytest_plugin` (e.g. in addopts) or
+`pytest_plugins = ["react_router_routes.pytest_plugin"]` in the root conftest.py.
+Point it at a routes JSON file with `--react-router-routes-json` (or the
+`react_router_routes_json` ini option) and use the `react_router_routes` fixture:
+
+    def test_user_url(react_router_routes):
+        assert react_router_routes.react_router_path("/users/:userId", {"user_id": 1}) == "/users/1"
+
+The module is generated once per fingerprint of the routes JSON, generator and
+options into a shared cache directory. Under pytest-xdist the workers take a
+file lock so only one of them generates; the others import the finished file.
+Each worker imports a given module once, and the run ends with a summary of
+the setup time that was skipped.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from . import generate
+from .generate import TypingStrategy, generate_route_types, route_ids_file
+
+LOCK_TIMEOUT_SECONDS = 300.0
+
+_STATS_KEY = "react_router_routes_stats"
+_stats_key = pytest.StashKey[dict[str, float]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("react-router-routes")
+    group.addoption(
+        "--react-router-routes-json",
+        dest="react_router_routes_json",
+        default=None,
+        help="routes JSON used by the react_router_routes fixture",
+    )
+    parser.addini(
+        "react_router_routes_json",
+        "routes JSON used by the react_router_routes fixture, relative to rootdir",
+        default=None,
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_stats_key] = {"generated": 0, "reused": 0, "saved_seconds": 0.0}
+
+
+@contextlib.contextmanager
+def file_lock(lock: Path, timeout: float = LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+    """Hold an exclusive lock file; portable across processes, no extra dependency.
+
+    A lock older than timeout is assumed to belong to a crashed process and is
+    broken.
+    """
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                stale = time.time() - lock.stat().st_mtime > timeout
+            except FileNotFoundError:
+                continue
+            if stale:
+                lock.unlink(missing_ok=True)
+                continue
+            time.sleep(0.05)
+
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        yield
+    finally:
+        os.close(fd)
+        lock.unlink(missing_ok=True)
+
+
+def routes_fingerprint(
+    json_file: Path, typing_strategy: TypingStrategy = TypingStrategy.overloads
+) -> str:
+    """Hash of everything that determines the generated module's contents."""
+    digest = hashlib.sha256()
+    digest.update(Path(generate.__file__).read_bytes())
+    digest.update(json_file.read_bytes())
+    digest.update(typing_strategy.value.encode())
+    return digest.hexdigest()
+
+
+class RoutesModuleCache:
+    """Generates and imports routes modules, at most once per fingerprint.
+
+    `stats` counts modules this process generated, loads served without
+    generating, and the generation plus import time those loads skipped.
+    """
+
+    def __init__(self, cache_dir: Path, stats: dict[str, float] | None = None):
+        self.cache_dir = cache_dir
+        self.stats = (
+            stats
+            if stats is not None
+            else {"generated": 0, "reused": 0, "saved_seconds": 0.0}
+        )
+        # fingerprint -> (module, seconds it took to import)
+        self._modules: dict[str, tuple[ModuleType, float]] = {}
+
+    def load(
+        self,
+        json_file: Path,
+        *,
+        typing_strategy: TypingStrategy = TypingStrategy.overloads,
+    ) -> ModuleType:
+        fingerprint = routes_fingerprint(json_file, typing_strategy)
+
+        if fingerprint in self._modules:
+            module, import_seconds = self._modules[fingerprint]
+            self._credit(fingerprint, import_seconds)
+            return module
+
+        generated_file = self._generated_file(fingerprint, json_file, typing_strategy)
+
+        started = time.perf_counter()
+        module_name = f"react_router_routes_{fingerprint[:16]}"
+        spec = importlib.util.spec_from_file_location(module_name, generated_file)
+        assert spec is not None
+        assert spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        self._modules[fingerprint] = (module, time.perf_counter() - started)
+        return module
+
+    def _generated_file(
+        self, fingerprint: str, json_file: Path, typing_strategy: TypingStrategy
+    ) -> Path:
+        generated_file = self.cache_dir / f"routes_{fingerprint[:16]}.py"
+        if generated_file.exists():
+            self._credit(fingerprint, 0.0)
+            return generated_file
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.cache_dir / f"routes_{fingerprint[:16]}.lock"):
+            # another worker may have finished while we waited for the lock
+            if generated_file.exists():
+                self._credit(fingerprint, 0.0)
+                return generated_file
+
+            # generate under a staging name, so a crash never leaves a partial module behind
+            staging_file = (
+                self.cache_dir / f".routes_{fingerprint[:16]}.{os.getpid()}.py"
+            )
+            started = time.perf_counter()
+            generate_route_types(
+                output_file=staging_file,
+                directory=None,
+                json_file=json_file,
+                typing_strategy=typing_strategy,
+                verbose=False,
+            )
+            timing_file(generated_file).write_text(
+                json.dumps({"generate_seconds": time.perf_counter() - started})
+            )
+            staging_file.replace(generated_file)
+            route_ids_file(staging_file).unlink(missing_ok=True)
+
+        self.stats["generated"] += 1
+        return generated_file
+
+    def _credit(self, fingerprint: str, import_seconds: float) -> None:
+        generated_file = self.cache_dir / f"routes_{fingerprint[:16]}.py"
+        generate_seconds = json.loads(timing_file(generated_file).read_text())[
+            "generate_seconds"
+        ]
+        self.stats["reused"] += 1
+        self.stats["saved_seconds"] += generate_seconds + import_seconds
+
+
+def timing_file(generated_file: Path) -> Path:
+    return generated_file.with_suffix(".timing.json")
+
+
+def _cache_dir(config: pytest.Config, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # the cache provider persists across runs and is shared by xdist workers;
+    # without it, fall back to the run's temp root, which xdist workers also share
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        return cache.mkdir("react_router_routes")
+    return tmp_path_factory.getbasetemp().parent / "react_router_routes"
+
+
+@pytest.fixture(scope="session")
+def react_router_routes_cache(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> RoutesModuleCache:
+    """Session-wide cache; call `.load(json_file)` for route trees other than the configured one."""
+    config = request.config
+    return RoutesModuleCache(
+        _cache_dir(config, tmp_path_factory), config.stash[_stats_key]
+    )
+
+
+@pytest.fixture(scope="module")
+def react_router_routes(
+    request: pytest.FixtureRequest, react_router_routes_cache: RoutesModuleCache
+) -> ModuleType:
+    """The generated routes module for the configured routes JSON."""
+    config = request.config
+    option = config.getoption("react_router_routes_json")
+    if option is not None:
+        json_file = Path(option)
+    else:
+        ini = config.getini("react_router_routes_json")
+        if not ini:
+            raise pytest.UsageError(
+                "react_router_routes fixture needs --react-router-routes-json or the react_router_routes_json ini option"
+            )
+        json_file = config.rootpath / ini
+
+    return react_router_routes_cache.load(json_file)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput[_STATS_KEY] = config.stash[_stats_key]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """Fold an xdist worker's stats into the controller's."""
+    worker_stats = getattr(node, "workeroutput", {}).get(_STATS_KEY)
+    if not worker_stats:
+        return
+
+    stats = node.config.stash[_stats_key]
+    for key, value in worker_stats.items():
+        stats[key] += value
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    stats = config.stash[_stats_key]
+    if not stats["generated"] and not stats["reused"]:
+        return
+
+    terminalreporter.write_line(
+        f"react-router-routes: generated {stats['generated']:.0f} routes module(s), "
+        f"reused {stats['reused']:.0f} time(s), saved {stats['saved_seconds']:.2f}s of setup"
+    )
@@ -0,0 +1,145 @@
+"""Keep the route patterns of past releases and find which releases a URL matched.
+
+Links in old emails and bookmarks point at route shapes that may no longer
+exist. The store records each release's pattern set as a bit in a per-pattern
+mask, so a pattern shared by hundreds of releases is stored once, and a
+lookup walks a single RouteMatcher built over the union of all patterns
+instead of matching against every release in turn.
+
+Store format (JSON):
+
+    {"version": 1, "releases": ["1.0.0", "1.1.0"], "patterns": {"/users/:userId": "0x3"}}
+
+Bit i of a pattern's mask is set when releases[i] had the pattern.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from .matcher import RouteMatcher
+from .table import write_atomically
+
+SNAPSHOT_STORE_VERSION = 1
+
+
+class SnapshotMatch(NamedTuple):
+    pattern: str
+    # snake_case param names, as in RouteMatch
+    params: dict[str, str]
+    # releases that had the pattern, oldest first
+    releases: tuple[str, ...]
+
+
+class RouteSnapshotStore:
+    """Versioned pattern sets, oldest release first.
+
+    Example:
+        store = RouteSnapshotStore.load(Path("routes.snapshots.json"))
+        store.add("2.4.0", patterns)
+        store.save(Path("routes.snapshots.json"))
+        store.match("/users/42")
+    """
+
+    __slots__ = ("_masks", "_matcher", "_releases")
+
+    def __init__(
+        self, releases: Iterable[str] = (), masks: dict[str, int] | None = None
+    ):
+        self._releases = list(releases)
+        self._masks: dict[str, int] = {} if masks is None else masks
+        self._matcher: RouteMatcher | None = None
+
+    @classmethod
+    def load(cls, store: Path) -> RouteSnapshotStore:
+        """Read a store written by save; a missing file is an empty store."""
+        if not store.exists():
+            return cls()
+
+        data = json.loads(store.read_text())
+        assert data.get("version") == SNAPSHOT_STORE_VERSION, (
+            f"unsupported route snapshot store version: {data.get('version')}"
+        )
+        masks = {pattern: int(mask, 16) for pattern, mask in data["patterns"].items()}
+        return cls(data["releases"], masks)
+
+    def save(self, store: Path) -> None:
+        """Write the store atomically."""
+        data = {
+            "version": SNAPSHOT_STORE_VERSION,
+            "releases": self._releases,
+            "patterns": {pattern: hex(mask) for pattern, mask in self._masks.items()},
+        }
+        write_atomically(store, json.dumps(data, separators=(",", ":")))
+
+    @property
+    def releases(self) -> tuple[str, ...]:
+        return tuple(self._releases)
+
+    def __len__(self) -> int:
+        return len(self._releases)
+
+    def __contains__(self, release: object) -> bool:
+        return release in self._releases
+
+    def add(self, release: str, patterns: Iterable[str]) -> None:
+        """Record release's patterns; adding an existing release replaces its snapshot."""
+        if release in self._releases:
+            bit = 1 << self._releases.index(release)
+            for pattern in list(self._masks):
+                self._clear_bit(pattern, bit)
+        else:
+            bit = 1 << len(self._releases)
+            self._releases.append(release)
+
+        for pattern in patterns:
+            self._masks[pattern] = self._masks.get(pattern, 0) | bit
+        self._matcher = None
+
+    def prune(self, keep: int) -> list[str]:
+        """Drop all but the newest `keep` releases; return the dropped ones."""
+        dropped = self._releases[: max(0, len(self._releases) - keep)]
+        if not dropped:
+            return []
+
+        shift = len(dropped)
+        self._releases = self._releases[shift:]
+        masks = {pattern: mask >> shift for pattern, mask in self._masks.items()}
+        self._masks = {pattern: mask for pattern, mask in masks.items() if mask}
+        self._matcher = None
+        return dropped
+
+    def patterns(self, release: str) -> list[str]:
+        """The pattern set recorded for release, in first-seen order."""
+        bit = 1 << self._releases.index(release)
+        return [pattern for pattern, mask in self._masks.items() if mask & bit]
+
+    def match(self, url: str) -> list[SnapshotMatch]:
+        """Every pattern from any release that matches url, best-ranked first.
+
+        An empty list means no retained release ever had a matching route.
+        """
+        if self._matcher is None:
+            self._matcher = RouteMatcher(self._masks)
+
+        return [
+            SnapshotMatch(
+                found.pattern, found.params, self._decode(self._masks[found.pattern])
+            )
+            for found in self._matcher.match_all(url)
+        ]
+
+    def _decode(self, mask: int) -> tuple[str, ...]:
+        return tuple(
+            release for index, release in enumerate(self._releases) if mask >> index & 1
+        )
+
+    def _clear_bit(self, pattern: str, bit: int) -> None:
+        mask = self._masks[pattern] & ~bit
+        if mask:
+            self._masks[pattern] = mask
+        else:
+            del self._masks[pattern]
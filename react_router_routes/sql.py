@@ -0,0 +1,155 @@
+"""Compile route patterns into SQL expressions that build paths inside the database.
+
+For exports of millions of rows, computing URLs in a `COPY ... SELECT` is far
+cheaper than pulling ids into Python to call react_router_url per row. Each
+pattern compiles to an expression template with `{snake_param}` placeholders
+for column expressions, applying the same optional-segment, splat and
+percent-encoding rules as the generated react_router_path:
+
+- a NULL optional param is omitted, a NULL required param makes the path NULL
+- values are UTF-8 percent-encoded like quote(value, safe=""), splats keep "/"
+- duplicate slashes are collapsed and a trailing slash is dropped
+
+Text, integer and uuid columns render exactly like the Python builders; other
+types go through the database's own text cast. Placeholders may be repeated
+in a template, so pass plain columns rather than expensive expressions.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from string import ascii_letters, digits
+
+from .generate import SAFE_PARAM_CHARS, SAFE_SPLAT_CHARS, compile_pattern_parts
+
+SQL_DIALECTS = ("postgresql", "sqlite")
+
+_SAFE_PARAM_BYTES = sorted(ord(char) for char in SAFE_PARAM_CHARS)
+_SAFE_SPLAT_BYTES = sorted(ord(char) for char in SAFE_SPLAT_CHARS)
+
+
+def _safe_class(safe: frozenset[str]) -> str:
+    """The safe set as a regex / GLOB bracket expression body ("-" last, so it is literal)."""
+    assert safe.issuperset(ascii_letters + digits)
+    punctuation = sorted(
+        set(safe) - set(ascii_letters + digits), key=lambda c: (c == "-", c)
+    )
+    return "A-Za-z0-9" + "".join(punctuation)
+
+
+def _byte_test(safe: list[int]) -> str:
+    """SQL condition on a byte column b that holds for the sorted safe bytes."""
+    runs: list[list[int]] = []
+    for byte in safe:
+        if runs and runs[-1][-1] == byte - 1:
+            runs[-1].append(byte)
+        else:
+            runs.append([byte])
+
+    ranges = [f"b BETWEEN {run[0]} AND {run[-1]}" for run in runs if len(run) > 2]
+    singles = [str(byte) for run in runs if len(run) <= 2 for byte in run]
+    return "(" + " OR ".join([*ranges, f"b IN ({', '.join(singles)})"]) + ")"
+
+
+_SAFE_PARAM_CLASS = _safe_class(SAFE_PARAM_CHARS)
+_SAFE_SPLAT_CLASS = _safe_class(SAFE_SPLAT_CHARS)
+
+# stands in for a param while the template is assembled, before braces are escaped
+_PLACEHOLDER = "\x00{}\x00"
+_PLACEHOLDER_RE = re.compile("\x00([a-z0-9_]+)\x00")
+
+
+def sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _encode_postgresql(value: str, splat: bool) -> str:
+    text = f"CAST({value} AS TEXT)"
+    safe_class = _SAFE_SPLAT_CLASS if splat else _SAFE_PARAM_CLASS
+    byte_test = _byte_test(_SAFE_SPLAT_BYTES if splat else _SAFE_PARAM_BYTES)
+    return (
+        f"CASE WHEN {text} ~ '^[{safe_class}]*$' THEN {text} ELSE ("
+        f"SELECT string_agg(CASE WHEN {byte_test} THEN chr(b) "
+        "ELSE '%' || upper(lpad(to_hex(b), 2, '0')) END, '' ORDER BY i) "
+        f"FROM (SELECT convert_to({text}, 'UTF8') AS bytes) AS v "
+        "CROSS JOIN LATERAL generate_series(0, length(v.bytes) - 1) AS i "
+        "CROSS JOIN LATERAL (SELECT get_byte(v.bytes, i) AS b) AS g"
+        ") END"
+    )
+
+
+def _encode_sqlite(value: str, splat: bool) -> str:
+    text = f"CAST({value} AS TEXT)"
+    safe_class = _SAFE_SPLAT_CLASS if splat else _SAFE_PARAM_CLASS
+    safe = _SAFE_SPLAT_BYTES if splat else _SAFE_PARAM_BYTES
+    safe_hex = "," + ",".join(f"{byte:02X}" for byte in safe) + ","
+    return (
+        f"CASE WHEN {text} NOT GLOB '*[^{safe_class}]*' THEN {text} ELSE ("
+        f"WITH RECURSIVE _bytes(b) AS (SELECT CAST({text} AS BLOB)), "
+        "_encoded(i, s) AS (SELECT 1, '' UNION ALL SELECT i + 1, s || CASE "
+        f"WHEN instr('{safe_hex}', ',' || hex(substr(b, i, 1)) || ',') "
+        "THEN CAST(substr(b, i, 1) AS TEXT) ELSE '%' || hex(substr(b, i, 1)) END "
+        "FROM _encoded, _bytes WHERE i <= length(b)) "
+        "SELECT s FROM _encoded, _bytes WHERE b IS NOT NULL ORDER BY i DESC LIMIT 1"
+        ") END"
+    )
+
+
+def _collapse_slashes_sqlite(expression: str, pattern: str, has_splat: bool) -> str:
+    if has_splat:
+        # splat values can carry runs of slashes of any length
+        return (
+            f"(WITH RECURSIVE _path(p) AS (SELECT {expression} "
+            "UNION ALL SELECT replace(p, '//', '/') FROM _path WHERE instr(p, '//') > 0) "
+            "SELECT p FROM _path WHERE instr(p, '//') = 0)"
+        )
+
+    # encoded params never contain "/", so runs are at most as long as the
+    # pattern's own slashes and each replace() pass halves them
+    for _ in range((pattern.count("/") - 1).bit_length()):
+        expression = f"replace({expression}, '//', '/')"
+    return expression
+
+
+def sql_path_template(pattern: str, dialect: str) -> str:
+    """SQL expression template computing react_router_path(pattern, ...) per row.
+
+    Fill it with `template.format(snake_param="column", ...)`, passing "NULL"
+    for omitted optional params.
+    """
+    assert dialect in SQL_DIALECTS, f"unsupported SQL dialect: {dialect}"
+    encode = _encode_postgresql if dialect == "postgresql" else _encode_sqlite
+
+    parts, tail = compile_pattern_parts(pattern)
+    pieces: list[str] = []
+    for static, name, kind in parts:
+        if static:
+            pieces.append(sql_literal(static))
+        encoded = f"({encode(_PLACEHOLDER.format(name), kind == 'splat')})"
+        pieces.append(f"COALESCE({encoded}, '')" if kind == "optional" else encoded)
+    if tail or not pieces:
+        pieces.append(sql_literal(tail))
+
+    expression = " || ".join(pieces)
+    if dialect == "postgresql":
+        expression = f"regexp_replace({expression}, '/{{2,}}', '/', 'g')"
+    else:
+        has_splat = any(kind == "splat" for _, _, kind in parts)
+        expression = _collapse_slashes_sqlite(expression, pattern, has_splat)
+
+    # every pattern starts with "/", so this drops a trailing slash but keeps "/"
+    expression = f"'/' || substr(rtrim({expression}, '/'), 2)"
+
+    escaped = expression.replace("{", "{{").replace("}", "}}")
+    return _PLACEHOLDER_RE.sub(r"{\1}", escaped)
+
+
+def sql_path_templates(patterns: Iterable[str]) -> dict[str, dict[str, str]]:
+    """pattern -> dialect -> template, for every supported dialect."""
+    return {
+        pattern: {
+            dialect: sql_path_template(pattern, dialect) for dialect in SQL_DIALECTS
+        }
+        for pattern in patterns
+    }
@@ -0,0 +1,246 @@
+"""Build and match routes at runtime, without generating a module.
+
+For services that fetch the routes manifest at deploy time instead of shipping
+a generated file. A RouteTable compiles the same builders as the generated
+`react_router_path` / `react_router_url` plus a RouteMatcher, and never changes
+after construction, so it can be built in a prefork server's master process
+and shared copy-on-write by every worker.
+"""
+
+from __future__ import annotations
+
+import functools
+import gc
+import json
+import os
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlencode
+
+from structlog_config import configure_logger
+
+from .generate import (
+    collect_route_patterns,
+    compile_pattern_parts,
+    encode_param,
+    encode_splat,
+    parse_params,
+)
+from .matcher import RouteMatch, RouteMatcher
+
+log = configure_logger()
+
+MANIFEST_VERSION = 1
+
+
+def join_path_chunks(chunks: list[str]) -> str:
+    """Join rendered chunks, collapsing duplicate slashes and dropping a trailing one."""
+    rendered = "".join(chunks)
+    while "//" in rendered:
+        rendered = rendered.replace("//", "/")
+    if rendered != "/" and rendered.endswith("/"):
+        rendered = rendered[:-1]
+    return rendered
+
+
+def write_atomically(path: Path, text: str) -> None:
+    """Write text through a temporary sibling file and rename it over path, so
+    readers never see a partial file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
+
+
+class CompiledRoute:
+    """Builder for one pattern, with static segments pre-joined."""
+
+    __slots__ = ("_aliases", "parts", "pattern", "tail")
+
+    def __init__(self, pattern: str):
+        parts, tail = compile_pattern_parts(pattern)
+        self.pattern = pattern
+        self.parts = tuple(parts)
+        self.tail = tail
+        # original camelCase tokens are accepted as well as snake_case keys
+        token_params, _ = parse_params(pattern)
+        snake_names = [name for _, name, kind in parts if kind != "splat"]
+        self._aliases = MappingProxyType(
+            dict(zip([token for token, _ in token_params], snake_names, strict=True))
+        )
+
+    def __repr__(self) -> str:
+        return f"CompiledRoute({self.pattern!r})"
+
+    def path(
+        self,
+        params: Mapping[str, object] | None = None,
+        *,
+        url_params: Mapping[str, str] | None = None,
+    ) -> str:
+        values: Mapping[str, object] = {} if params is None else params
+        if self._aliases and not self._aliases.keys().isdisjoint(values):
+            values = {
+                self._aliases.get(key, key): value for key, value in values.items()
+            }
+
+        chunks: list[str] = []
+        for static, name, kind in self.parts:
+            chunks.append(static)
+            if kind == "optional" and name not in values:
+                continue
+            assert name in values, f"missing required param: {name}"
+            if kind == "splat":
+                chunks.append(encode_splat(values[name]))
+            else:
+                chunks.append(encode_param(values[name]))
+        chunks.append(self.tail)
+
+        rendered = join_path_chunks(chunks)
+        if url_params:
+            rendered += f"?{urlencode(url_params)}"
+        return rendered
+
+
+class RouteTable:
+    """Immutable set of compiled route builders and a matcher.
+
+    Example:
+        table = RouteTable.from_json(Path("routes.json")).freeze()
+        table.url("/users/:userId", {"user_id": 1}, base_url="https://example.com")
+        table.match("/users/1")
+    """
+
+    __slots__ = ("_matcher", "_routes", "patterns")
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = tuple(patterns)
+        self._routes = MappingProxyType(
+            {pattern: CompiledRoute(pattern) for pattern in patterns}
+        )
+        self._matcher = RouteMatcher(patterns)
+
+    @classmethod
+    def from_json(cls, routes_json: str | bytes | Path | list[dict]) -> RouteTable:
+        """Compile from `react-router routes --json` output: raw JSON, a file, or parsed data."""
+        raw = routes_json.read_bytes() if isinstance(routes_json, Path) else routes_json
+        routes = json.loads(raw) if isinstance(raw, str | bytes) else raw
+        return cls(collect_route_patterns(routes))
+
+    @classmethod
+    def load_manifest(cls, manifest: Path) -> RouteTable:
+        """Load a plain JSON manifest written by save_manifest."""
+        data = json.loads(manifest.read_bytes())
+
+        assert data.get("version") == MANIFEST_VERSION, (
+            f"unsupported route manifest version: {data.get('version')}"
+        )
+        return cls(data["patterns"])
+
+    def save_manifest(self, manifest: Path) -> None:
+        """Write the flattened pattern list atomically."""
+        write_atomically(
+            manifest,
+            json.dumps({"version": MANIFEST_VERSION, "patterns": list(self.patterns)}),
+        )
+
+    def freeze(self) -> RouteTable:
+        """Move everything allocated so far out of the GC's reach before forking.
+
+        Without this, the first collection in each worker touches every object
+        and breaks copy-on-write sharing of the table's pages. Call it in the
+        master process right before the server forks.
+        """
+        gc.collect()
+        gc.freeze()
+        return self
+
+    def __contains__(self, pattern: object) -> bool:
+        return pattern in self._routes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def route(self, pattern: str) -> CompiledRoute:
+        return self._routes[pattern]
+
+    def path(
+        self,
+        pattern: str,
+        params: Mapping[str, object] | None = None,
+        *,
+        url_params: Mapping[str, str] | None = None,
+    ) -> str:
+        """Same output as the generated react_router_path."""
+        return self._routes[pattern].path(params, url_params=url_params)
+
+    def url(
+        self,
+        pattern: str,
+        params: Mapping[str, object] | None = None,
+        *,
+        base_url: str | None = None,
+        url_params: Mapping[str, str] | None = None,
+    ) -> str:
+        """Same output as the generated react_router_url."""
+        built = self.path(pattern, params, url_params=url_params)
+        base = base_url if base_url is not None else os.environ.get("BASE_URL")
+        if not base:
+            _warn_missing_base_url(pattern)
+            return built
+
+        return base.rstrip("/") + built
+
+    def match(self, url: str) -> RouteMatch | None:
+        return self._matcher.match(url)
+
+
+@functools.cache
+def _warn_missing_base_url(pattern: str) -> None:
+    """Log once per pattern per process; kept off RouteTable so tables stay immutable."""
+    log.warning("base_url missing, returning path only", pattern=pattern)
+
+
+class RouteTableHandle:
+    """Holds the live RouteTable and swaps in a new one without restarting workers.
+
+    Readers take `handle.table` once per request; replacing the reference is a
+    single atomic assignment, so in-flight requests keep the table they started
+    with.
+    """
+
+    __slots__ = ("_manifest", "_manifest_mtime_ns", "_table")
+
+    def __init__(self, table: RouteTable, manifest: Path | None = None):
+        self._table = table
+        self._manifest = manifest
+        self._manifest_mtime_ns = manifest.stat().st_mtime_ns if manifest else None
+
+    @classmethod
+    def from_manifest(cls, manifest: Path) -> RouteTableHandle:
+        return cls(RouteTable.load_manifest(manifest), manifest)
+
+    @property
+    def table(self) -> RouteTable:
+        return self._table
+
+    def swap(self, table: RouteTable) -> RouteTable:
+        """Install a new table and return the previous one."""
+        previous = self._table
+        self._table = table
+        return previous
+
+    def reload_if_changed(self) -> bool:
+        """Reload from the manifest when its mtime moved; returns True if swapped."""
+        assert self._manifest is not None, "handle was not created from a manifest"
+        mtime_ns = self._manifest.stat().st_mtime_ns
+        if mtime_ns == self._manifest_mtime_ns:
+            return False
+
+        self.swap(RouteTable.load_manifest(self._manifest))
+        self._manifest_mtime_ns = mtime_ns
+        log.info("reloaded route manifest", manifest=self._manifest)
+        return True
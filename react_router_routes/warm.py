@@ -0,0 +1,312 @@
+"""Warm CDN and SSR caches after a deploy by requesting every route once.
+
+Every route without required params is requested, plus a sample of concrete
+URLs for dynamic routes taken from a params file. URLs are built by a
+RouteTable, so they match what the generated react_router_url produces.
+Requests go through one asyncio HTTP client with a bounded pool of keep-alive
+connections and an optional global rate limit, and latency and status codes
+are reported per pattern.
+
+Needs httpx: `pip install 'react-router-routes[warm]'`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import time
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from .generate import (
+    camel_to_snake,
+    collect_route_patterns,
+    compile_pattern_parts,
+    load_routes_json,
+    parse_params,
+)
+from .table import RouteTable
+
+
+class RateLimiter:
+    """Token bucket shared by all workers; rate is requests per second."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class PatternStats:
+    """Status codes and latencies of the warm-up requests for one pattern."""
+
+    __slots__ = ("latencies", "statuses")
+
+    def __init__(self) -> None:
+        # status code, or "error" when the request did not complete
+        self.statuses: Counter[int | str] = Counter()
+        self.latencies: list[float] = []
+
+    def record(self, status: int | str, latency: float) -> None:
+        self.statuses[status] += 1
+        self.latencies.append(latency)
+
+    def percentile(self, fraction: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "requests": len(self.latencies),
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+            "p50_ms": round(self.percentile(0.5) * 1000, 1),
+            "p95_ms": round(self.percentile(0.95) * 1000, 1),
+            "max_ms": round(max(self.latencies) * 1000, 1),
+        }
+
+
+def warm_targets(
+    table: RouteTable,
+    params: Mapping[str, list[Mapping[str, object]]],
+    *,
+    base_url: str,
+    sample: int,
+    seed: int | None = None,
+) -> list[tuple[str, str]]:
+    """(pattern, url) for every route without required params, plus up to
+    `sample` randomly chosen param sets per pattern from params.
+
+    Raises ValueError when params names a pattern that is not a route or has a
+    param set that does not fit its pattern, and TypeError when it is not
+    shaped like pattern -> list of objects.
+    """
+    if not isinstance(params, Mapping):
+        raise TypeError("expected an object of pattern -> list of params")
+    unknown = sorted(set(params) - set(table.patterns))
+    if unknown:
+        raise ValueError(f"unknown patterns: {', '.join(unknown)}")
+    for pattern, param_sets in params.items():
+        _check_param_sets(pattern, param_sets)
+
+    rng = random.Random(seed)
+    targets: list[tuple[str, str]] = []
+    for pattern in table.patterns:
+        parts, _ = compile_pattern_parts(pattern)
+        if all(kind == "optional" for _, _, kind in parts):
+            targets.append((pattern, table.url(pattern, base_url=base_url)))
+
+        candidates = params.get(pattern, [])
+        chosen = rng.sample(candidates, min(sample, len(candidates)))
+        targets.extend(
+            (pattern, table.url(pattern, values, base_url=base_url))
+            for values in chosen
+        )
+    return targets
+
+
+def _check_param_sets(pattern: str, param_sets: object) -> None:
+    """Raise ValueError or TypeError unless param_sets is a list of complete params for pattern.
+
+    Keys may be snake_case or the original tokens, as in RouteTable.path.
+    """
+    if not isinstance(param_sets, list):
+        raise TypeError(f"params for {pattern} must be a list")
+
+    parts, _ = compile_pattern_parts(pattern)
+    names = {name for _, name, _ in parts}
+    required = {name for _, name, kind in parts if kind != "optional"}
+    aliases = {token: camel_to_snake(token) for token, _ in parse_params(pattern)[0]}
+    for index, values in enumerate(param_sets):
+        if not isinstance(values, Mapping):
+            raise TypeError(f"params #{index} for {pattern} must be an object")
+
+        keys = {aliases.get(str(key), str(key)) for key in values}
+        given = {
+            aliases.get(str(key), str(key))
+            for key, value in values.items()
+            if value is not None
+        }
+        unexpected = sorted(keys - names)
+        if unexpected:
+            raise ValueError(
+                f"params #{index} for {pattern} has unexpected params: {', '.join(unexpected)}"
+            )
+        missing = sorted(required - given)
+        if missing:
+            raise ValueError(
+                f"params #{index} for {pattern} is missing required param: {', '.join(missing)}"
+            )
+
+
+async def warm_urls(
+    targets: list[tuple[str, str]],
+    *,
+    concurrency: int = 16,
+    rate: float | None = None,
+    timeout: float = 30.0,
+    headers: Mapping[str, str] | None = None,
+) -> dict[str, PatternStats]:
+    """Request every target with at most `concurrency` in flight; return stats per pattern."""
+    import httpx
+
+    stats: dict[str, PatternStats] = {pattern: PatternStats() for pattern, _ in targets}
+    # shared by the workers; next() never awaits, so each target is taken once
+    pending = iter(targets)
+    limiter = RateLimiter(rate, burst=concurrency) if rate else None
+
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        limits=limits, timeout=timeout, headers=headers
+    ) as client:
+
+        async def worker() -> None:
+            for pattern, url in pending:
+                if limiter is not None:
+                    await limiter.acquire()
+
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    # read the body so the connection goes back to the pool
+                    await response.aread()
+                    status: int | str = response.status_code
+                except httpx.HTTPError:
+                    status = "error"
+                stats[pattern].record(status, time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(targets)))))
+
+    return stats
+
+
+def warm_cache(
+    base_url: Annotated[
+        str | None,
+        typer.Option(
+            "--base-url",
+            "-b",
+            help="Origin to warm, e.g. https://example.com (defaults to ENV BASE_URL)",
+        ),
+    ] = None,
+    directory: Annotated[
+        Path | None,
+        typer.Option(
+            "--directory",
+            "-d",
+            help="Path to React Router project directory (auto-detects package manager: bun, pnpm, or npm)",
+        ),
+    ] = None,
+    json_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--json-file",
+            "-j",
+            help="Path to an existing react-router routes JSON file (skips package manager detection)",
+        ),
+    ] = None,
+    params_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--params",
+            "-p",
+            help='JSON object of pattern -> list of params to sample dynamic routes from, e.g. {"/users/:userId": [{"user_id": 1}]}',
+        ),
+    ] = None,
+    sample: Annotated[
+        int,
+        typer.Option(
+            "--sample", "-n", help="Param sets to request per dynamic pattern"
+        ),
+    ] = 10,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency", "-c", help="Maximum requests (and connections) in flight"
+        ),
+    ] = 16,
+    rate: Annotated[
+        float | None,
+        typer.Option(
+            "--rate", help="Maximum requests per second across all connections"
+        ),
+    ] = None,
+    timeout: Annotated[
+        float, typer.Option("--timeout", help="Per-request timeout in seconds")
+    ] = 30.0,
+    seed: Annotated[
+        int | None,
+        typer.Option("--seed", help="Random seed for sampling, for repeatable runs"),
+    ] = None,
+    report: Annotated[
+        Path | None,
+        typer.Option(
+            "--report", help="Also write the per-pattern report as JSON to this file"
+        ),
+    ] = None,
+):
+    """Request every static route and a sample of dynamic routes to warm caches after a deploy."""
+    base = base_url or os.environ.get("BASE_URL")
+    if not base:
+        typer.echo("A base URL is required: pass --base-url or set BASE_URL", err=True)
+        raise typer.Exit(1)
+
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        typer.echo(
+            "warm-cache needs httpx: pip install 'react-router-routes[warm]'", err=True
+        )
+        raise typer.Exit(1)
+
+    table = RouteTable(collect_route_patterns(load_routes_json(directory, json_file)))
+    try:
+        # a JSONDecodeError is a ValueError, so it is reported the same way
+        params = json.loads(params_file.read_text()) if params_file else {}
+        targets = warm_targets(table, params, base_url=base, sample=sample, seed=seed)
+    except (TypeError, ValueError) as error:
+        typer.echo(f"Invalid params file: {error}", err=True)
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    stats = asyncio.run(
+        warm_urls(targets, concurrency=concurrency, rate=rate, timeout=timeout)
+    )
+    elapsed = time.perf_counter() - started
+
+    for pattern, pattern_stats in stats.items():
+        statuses = " ".join(
+            f"{status}x{count}" for status, count in pattern_stats.statuses.items()
+        )
+        typer.echo(
+            f"{pattern}  {len(pattern_stats.latencies)} req  {statuses}  "
+            f"p50 {pattern_stats.percentile(0.5) * 1000:.1f}ms  "
+            f"p95 {pattern_stats.percentile(0.95) * 1000:.1f}ms"
+        )
+    typer.echo(f"Warmed {len(targets)} URLs in {elapsed:.1f}s", err=True)
+
+    if report is not None:
+        summaries = {pattern: item.summary() for pattern, item in stats.items()}
+        report.write_text(json.dumps(summaries, indent=2))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import importlib.util
+import itertools
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from react_router_routes.generate import generate_route_types
+
+ROUTES_JSON_FILE = Path(__file__).parent / "react-router.json"
+
+_module_ids = itertools.count()
+
+
+def _routes_json(patterns: list[str]) -> str:
+    children = [
+        {"id": f"routes/{i}", "path": path, "file": f"routes/{i}.tsx"}
+        for i, path in enumerate(patterns)
+    ]
+    return json.dumps(
+        [{"id": "root", "path": "", "file": "root.tsx", "children": children}]
+    )
+
+
+def _import_routes_module(output: Path) -> ModuleType:
+    """Import a generated module under a fresh name, so earlier imports never leak in."""
+    module_name = f"routes_typing_{next(_module_ids)}"
+    spec = importlib.util.spec_from_file_location(module_name, output)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def load_routes_module(tmp_path: Path) -> Callable[..., ModuleType]:
+    """Generate tmp_path/routes_typing.py and import it.
+
+    Takes routes JSON text, a routes JSON file, or a list of patterns (children
+    of a pathless root route); extra keywords go to generate_route_types.
+    Calling it again regenerates into the same file, next to the same
+    .route-ids.json lockfile.
+    """
+
+    def load(
+        routes: str | Path | list[str] = ROUTES_JSON_FILE, **options: object
+    ) -> ModuleType:
+        if isinstance(routes, Path):
+            json_file = routes
+        else:
+            json_file = tmp_path / "test_routes.json"
+            json_file.write_text(
+                routes if isinstance(routes, str) else _routes_json(routes)
+            )
+
+        output = tmp_path / "routes_typing.py"
+        generate_route_types(
+            output_file=output,
+            directory=None,
+            json_file=json_file,
+            **options,  # type: ignore[arg-type]
+        )
+        return _import_routes_module(output)
+
+    return load
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import ModuleType
+
+import pytest
+from jinja2 import Environment, TemplateSyntaxError
+
+from react_router_routes.jinja import RoutesExtension
+
+ROUTES_JSON = """[
+  {
+    "id": "root",
+    "path": "",
+    "file": "root.tsx",
+    "children": [
+      {"id": "routes/home", "path": "/home", "file": "routes/home.tsx"},
+      {"id": "routes/user", "path": "/users/:userId", "file": "routes/user.tsx"},
+      {"id": "routes/files", "path": "/files/*", "file": "routes/files.tsx"}
+    ]
+  }
+]"""
+
+
+@pytest.fixture
+def env(load_routes_module: Callable[..., ModuleType]) -> Environment:
+    environment = Environment(extensions=[RoutesExtension], autoescape=True)
+    environment.react_router_routes = load_routes_module(ROUTES_JSON)  # type: ignore[attr-defined]
+    return environment
+
+
+def test_constant_links_are_folded(env: Environment) -> None:
+    source = (
+        '{% route_path "/home", url_params={"a": "1", "b": "2"} %} '
+        '{% route_path "/users/:userId", user_id=42 %} '
+        '{% route_url "/home", base_url="https://example.com" %}'
+    )
+
+    compiled = env.compile(source, raw=True)
+
+    assert "_route_path" not in compiled
+    assert "_route_url" not in compiled
+    assert (
+        env.from_string(source).render()
+        == "/home?a=1&amp;b=2 /users/42 https://example.com/home"
+    )
+
+
+def test_dynamic_links_call_route_builders(env: Environment) -> None:
+    source = (
+        '{% route_path "/users/:userId", user_id=user.id %} '
+        '{% route_path "/files/*", splat=path %} '
+        '{% route_url "/home" %}'
+    )
+    env.react_router_base_url = "https://example.com"  # type: ignore[attr-defined]
+
+    compiled = env.compile(source, raw=True)
+    assert "_route_path" in compiled
+    assert "https://example.com/home" in compiled
+
+    rendered = env.from_string(source).render(
+        user={"id": "a b"}, path="docs/read me.md"
+    )
+    assert rendered == "/users/a%20b /files/docs/read%20me.md https://example.com/home"
+
+
+def test_route_url_without_base_url_is_resolved_at_render(
+    env: Environment, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    template = env.from_string('{% route_url "/home" %}')
+
+    monkeypatch.setenv("BASE_URL", "https://env.example.com")
+    assert template.render() == "https://env.example.com/home"
+
+
+@pytest.mark.parametrize(
+    ("source", "message"),
+    [
+        ('{% route_path "/nope" %}', "unknown route pattern: /nope"),
+        ("{% route_path name %}", "needs a string literal route pattern"),
+        ('{% route_path "/users/:userId" %}', "missing required param: user_id"),
+        (
+            '{% route_path "/users/:userId", user_id=1, userId=1 %}',
+            "unexpected params for /users/:userId: userId",
+        ),
+        ('{% route_path "/home", base_url="x" %}', "unexpected params"),
+        (
+            '{% route_path "/users/:userId", user_id=none %}',
+            "missing required param: user_id",
+        ),
+        (
+            '{% route_path "/users/:userId", user_id=1, user_id=2 %}',
+            "duplicate param: user_id",
+        ),
+    ],
+)
+def test_invalid_links_fail_at_compile_time(
+    env: Environment, source: str, message: str
+) -> None:
+    with pytest.raises(TemplateSyntaxError, match=message):
+        env.from_string(source)
+
+
+def test_requires_routes_module() -> None:
+    env = Environment(extensions=[RoutesExtension])
+
+    with pytest.raises(TemplateSyntaxError, match="react_router_routes"):
+        env.from_string('{% route_path "/home" %}')
+
+
+def test_param_named_like_a_route_argument(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    environment = Environment(extensions=[RoutesExtension])
+    environment.react_router_routes = load_routes_module(["/proxy/:baseUrl"])  # type: ignore[attr-defined]
+
+    template = environment.from_string(
+        '{% route_path "/proxy/:baseUrl", base_url="a" %} '
+        '{% route_path "/proxy/:baseUrl", base_url=value %}'
+    )
+
+    assert template.render(value="b c") == "/proxy/a /proxy/b%20c"
@@ -0,0 +1,107 @@
+"""Tests for the check-links subcommand."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from react_router_routes.cli import subcommands
+from react_router_routes.link_check import check_links_file, iter_line_chunks
+
+PATTERNS = ["/", "/home", "/users/:userId"]
+
+URLS = [
+    "/",
+    "https://example.com/home?x=1",
+    "/users/42",
+    "/missing",
+    "",
+    "/users/42/extra",
+]
+
+
+def _write_urls(tmp_path: Path, count: int = 1) -> Path:
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text("\n".join(URLS * count) + "\n")
+    return urls_file
+
+
+def test_iter_line_chunks_align_to_newlines(tmp_path: Path) -> None:
+    urls_file = _write_urls(tmp_path)
+    data = urls_file.read_bytes()
+
+    chunks = list(iter_line_chunks(urls_file, 7))
+
+    assert chunks[0][0] == 0
+    assert chunks[-1][1] == len(data)
+    for start, end in chunks:
+        assert data[end - 1 : end] == b"\n"
+        assert start == 0 or data[start - 1 : start] == b"\n"
+
+
+def test_iter_line_chunks_empty_file(tmp_path: Path) -> None:
+    urls_file = tmp_path / "empty.txt"
+    urls_file.touch()
+
+    assert list(iter_line_chunks(urls_file, 7)) == []
+
+
+def test_check_links_file_in_process(tmp_path: Path) -> None:
+    out = io.StringIO()
+
+    matched, dead = check_links_file(PATTERNS, _write_urls(tmp_path), out)
+
+    assert (matched, dead) == (3, 2)
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert results[2] == {
+        "url": "/users/42",
+        "status": "matched",
+        "pattern": "/users/:userId",
+        "params": {"user_id": "42"},
+    }
+    assert [r["status"] for r in results] == [
+        "matched",
+        "matched",
+        "matched",
+        "dead",
+        "dead",
+    ]
+
+
+def test_check_links_file_process_pool_preserves_order(tmp_path: Path) -> None:
+    urls_file = _write_urls(tmp_path, count=50)
+    serial = io.StringIO()
+    parallel = io.StringIO()
+
+    check_links_file(PATTERNS, urls_file, serial, chunk_size=64)
+    totals = check_links_file(PATTERNS, urls_file, parallel, workers=2, chunk_size=64)
+
+    assert totals == (150, 100)
+    assert parallel.getvalue() == serial.getvalue()
+
+
+def test_check_links_cli_dead_only(tmp_path: Path) -> None:
+    routes_json = Path(__file__).parent / "react-router.json"
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner().invoke(
+        subcommands,
+        [
+            "check-links",
+            str(_write_urls(tmp_path)),
+            "--json-file",
+            str(routes_json),
+            "--workers",
+            "1",
+            "--dead-only",
+            "--output",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    urls = [json.loads(line)["url"] for line in output.read_text().splitlines()]
+    assert urls == ["/users/42", "/missing", "/users/42/extra"]
@@ -0,0 +1,118 @@
+"""Tests for running the project's local react-router bin directly."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from react_router_routes.generate import (
+    generate_route_types,
+    react_router_bin_command,
+    resolve_react_router_bin,
+)
+
+ROUTES_STDOUT = '[{"id": "root", "path": "", "file": "root.tsx", "children": [{"id": "routes/direct", "path": "/direct", "file": "routes/direct.tsx"}]}]'
+
+
+@pytest.fixture(autouse=True)
+def _clear_bin_cache():
+    resolve_react_router_bin.cache_clear()
+    yield
+    resolve_react_router_bin.cache_clear()
+
+
+def _install_react_router(root: Path) -> Path:
+    """Mimic npm's layout: .bin/react-router symlinks to the package's JS entrypoint."""
+    entrypoint = root / "node_modules" / "@react-router" / "dev" / "bin.js"
+    entrypoint.parent.mkdir(parents=True)
+    entrypoint.write_text("#!/usr/bin/env node\n")
+    bin_dir = root / "node_modules" / ".bin"
+    bin_dir.mkdir()
+    (bin_dir / "react-router").symlink_to(entrypoint)
+    return entrypoint
+
+
+def test_resolve_react_router_bin_in_monorepo_ancestor(tmp_path: Path) -> None:
+    entrypoint = _install_react_router(tmp_path)
+    app_dir = tmp_path / "apps" / "web"
+    app_dir.mkdir(parents=True)
+
+    assert resolve_react_router_bin(app_dir) == entrypoint.resolve()
+    assert resolve_react_router_bin(tmp_path / "apps") == entrypoint.resolve()
+
+
+def test_resolve_react_router_bin_missing(tmp_path: Path) -> None:
+    assert resolve_react_router_bin(tmp_path) is None
+
+
+def test_react_router_bin_command_runs_node_scripts_with_node(tmp_path: Path) -> None:
+    entrypoint = _install_react_router(tmp_path)
+
+    with patch("shutil.which", return_value="/usr/bin/node"):
+        assert react_router_bin_command(entrypoint) == [
+            "/usr/bin/node",
+            str(entrypoint),
+        ]
+
+    with patch("shutil.which", return_value=None):
+        assert react_router_bin_command(entrypoint) is None
+
+
+def test_react_router_bin_command_executes_shell_shims(tmp_path: Path) -> None:
+    shim = tmp_path / "react-router"
+    shim.write_text('#!/bin/sh\nexec node "$basedir/../react-router/bin.js" "$@"\n')
+
+    assert react_router_bin_command(shim) == [str(shim)]
+
+
+def test_generate_route_types_uses_local_bin(tmp_path: Path) -> None:
+    entrypoint = _install_react_router(tmp_path)
+    output_file = tmp_path / "output.py"
+
+    def mock_run_side_effect(args, **kwargs):
+        if args == ["/usr/bin/node", str(entrypoint.resolve()), "routes", "--json"]:
+            return subprocess.CompletedProcess(args, 0, stdout=ROUTES_STDOUT)
+        raise FileNotFoundError(f"Unexpected command: {args}")
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/node"),
+        patch(
+            "react_router_routes.generate.subprocess.run",
+            side_effect=mock_run_side_effect,
+        ) as mock_run,
+    ):
+        generate_route_types(
+            output_file=output_file, directory=tmp_path, json_file=None
+        )
+
+    # no package manager detection happens when the local bin is used
+    assert not any(
+        call.args[0][0] in {"bun", "pnpm", "npm", "yarn"}
+        for call in mock_run.call_args_list
+    )
+    assert '"/direct"' in output_file.read_text()
+
+
+def test_generate_route_types_no_direct_uses_package_manager(tmp_path: Path) -> None:
+    _install_react_router(tmp_path)
+    (tmp_path / "package-lock.json").touch()
+    output_file = tmp_path / "output.py"
+
+    def mock_run_side_effect(args, **kwargs):
+        if args == ["npm", "--version"]:
+            return subprocess.CompletedProcess(args, 0, stdout="10.0.0")
+        if args == ["npm", "react-router", "routes", "--json"]:
+            return subprocess.CompletedProcess(args, 0, stdout=ROUTES_STDOUT)
+        raise FileNotFoundError(f"Unexpected command: {args}")
+
+    with patch(
+        "react_router_routes.generate.subprocess.run", side_effect=mock_run_side_effect
+    ):
+        generate_route_types(
+            output_file=output_file, directory=tmp_path, json_file=None, direct=False
+        )
+
+    assert '"/direct"' in output_file.read_text()
@@ -0,0 +1,69 @@
+"""Tests for the segment-trie route matcher."""
+
+from __future__ import annotations
+
+from react_router_routes.generate import expand_optional_segments
+from react_router_routes.matcher import RouteMatch, RouteMatcher
+
+PATTERNS = [
+    "/",
+    "/users/:userId",
+    "/users/new",
+    "/files/*",
+    "/optional/:id?",
+    "/orgs/:orgId/projects/:projectId",
+]
+
+
+def test_expand_optional_segments() -> None:
+    assert expand_optional_segments("/users/:userId?") == [
+        ["users", ":userId"],
+        ["users"],
+    ]
+    assert expand_optional_segments("/") == [[]]
+
+
+def test_match_ranks_static_before_dynamic() -> None:
+    matcher = RouteMatcher(PATTERNS)
+
+    assert matcher.match("/users/new") == RouteMatch("/users/new", {})
+    assert matcher.match("/users/12") == RouteMatch("/users/:userId", {"user_id": "12"})
+
+
+def test_match_params_splats_and_optionals() -> None:
+    matcher = RouteMatcher(PATTERNS)
+
+    assert matcher.match("/") == RouteMatch("/", {})
+    assert matcher.match("https://example.com/orgs/1/projects/a%20b?tab=x#top") == (
+        RouteMatch(
+            "/orgs/:orgId/projects/:projectId", {"org_id": "1", "project_id": "a b"}
+        )
+    )
+    assert matcher.match("/files") == RouteMatch("/files/*", {"splat": ""})
+    assert matcher.match("/files/docs/readme.md") == RouteMatch(
+        "/files/*", {"splat": "docs/readme.md"}
+    )
+    assert matcher.match("/optional") == RouteMatch("/optional/:id?", {})
+    assert matcher.match("/optional/5/") == RouteMatch("/optional/:id?", {"id": "5"})
+
+
+def test_match_dead_links() -> None:
+    matcher = RouteMatcher(PATTERNS)
+
+    assert matcher.match("/missing") is None
+    assert matcher.match("/users/1/2") is None
+
+
+def test_case_sensitivity() -> None:
+    assert RouteMatcher(PATTERNS).match("/Users/NEW") == RouteMatch("/users/new", {})
+    assert RouteMatcher(PATTERNS, case_sensitive=True).match("/Users/NEW") is None
+
+
+def test_match_all() -> None:
+    matcher = RouteMatcher([*PATTERNS, "/*"])
+
+    assert [m.pattern for m in matcher.match_all("/users/new")] == [
+        "/users/new",
+        "/users/:userId",
+        "/*",
+    ]
@@ -0,0 +1,71 @@
+"""The type-aware encoding fast path must match quote() exactly."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from decimal import Decimal
+from enum import IntEnum
+from types import ModuleType
+from urllib.parse import quote
+
+from react_router_routes.generate import (
+    SAFE_PARAM_CHARS,
+    encode_param,
+    encode_splat,
+)
+
+
+class Color(IntEnum):
+    RED = 1
+
+
+VALUES: list[object] = [
+    0,
+    -42,
+    10**30,
+    True,
+    Color.RED,
+    uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "",
+    "slug-with_dots.and~tilde",
+    "ABCxyz123",
+    "a b",
+    "a/b",
+    "q&a=1",
+    "café",
+    "日本",
+    "100%",
+    Decimal("1.50"),
+    3.5,
+    None,
+]
+
+
+def test_encode_param_matches_quote(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module()
+
+    for value in VALUES:
+        assert routes_typing._encode_param(value) == quote(str(value), safe="")
+
+
+def test_encode_splat_matches_quote(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module()
+
+    for value in [*VALUES, "docs/readme.md", "/leading/and/trailing/", "a b/c"]:
+        assert routes_typing._encode_splat(value) == quote(str(value), safe="/")
+
+
+def test_generated_encoders_match_package(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module()
+
+    assert routes_typing._SAFE_PARAM_CHARS == SAFE_PARAM_CHARS
+    for value in [*VALUES, "docs/readme.md"]:
+        assert routes_typing._encode_param(value) == encode_param(value)
+        assert routes_typing._encode_splat(value) == encode_splat(value)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import ModuleType
+
+PATTERNS = [
+    "/",
+    "/orgs/:orgId",
+    "/orgs/:orgId/settings/:tab?",
+    "/orgs/:orgId/projects/:projectId",
+    "/users/:userId",
+    "/files/*",
+]
+
+
+def test_param_index(load_routes_module: Callable[..., ModuleType]) -> None:
+    routes_typing = load_routes_module(PATTERNS)
+
+    assert routes_typing.PARAM_INDEX == {
+        "org_id": (
+            "/orgs/:orgId",
+            "/orgs/:orgId/settings/:tab?",
+            "/orgs/:orgId/projects/:projectId",
+        ),
+        "tab": ("/orgs/:orgId/settings/:tab?",),
+        "project_id": ("/orgs/:orgId/projects/:projectId",),
+        "user_id": ("/users/:userId",),
+    }
+
+
+def test_expand_paths_yields_fully_determined_routes(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(PATTERNS)
+
+    assert list(routes_typing.expand_paths([{"org_id": "acme"}])) == [
+        "/orgs/acme",
+        "/orgs/acme/settings",
+    ]
+    assert list(
+        routes_typing.expand_paths(
+            [{"org_id": 1, "project_id": 2}, {"user_id": "a b"}, {"unknown": 1}]
+        )
+    ) == [
+        "/orgs/1",
+        "/orgs/1/settings",
+        "/orgs/1/projects/2",
+        "/users/a%20b",
+    ]
+
+
+def test_expand_paths_treats_none_as_unbound(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(PATTERNS)
+
+    assert list(
+        routes_typing.expand_paths(
+            [{"user_id": None}, {"org_id": "acme", "project_id": None, "tab": None}]
+        )
+    ) == ["/orgs/acme", "/orgs/acme/settings"]
+
+
+def test_expand_urls_streams_lazily(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(PATTERNS)
+    consumed: list[int] = []
+
+    def bindings():
+        for i in range(100_000):
+            consumed.append(i)
+            yield {"user_id": i}
+
+    urls = routes_typing.expand_urls(bindings(), base_url="https://example.com")
+
+    assert next(urls) == "https://example.com/users/0"
+    assert next(urls) == "https://example.com/users/1"
+    assert consumed == [0, 1]
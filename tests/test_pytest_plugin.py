@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from react_router_routes.pytest_plugin import RoutesModuleCache, file_lock
+
+pytest_plugins = ["pytester"]
+
+ROUTES_JSON = Path(__file__).parent / "react-router.json"
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def routes_pytester(
+    pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+) -> pytest.Pytester:
+    # the subprocess must import the package even when it is not installed
+    monkeypatch.setenv("PYTHONPATH", str(PROJECT_ROOT))
+    shutil.copy(ROUTES_JSON, pytester.path / "routes.json")
+    return pytester
+
+
+TEST_MODULE = """
+def test_path(react_router_routes):
+    assert react_router_routes.react_router_path("/home") == "/home"
+"""
+
+
+def test_cache_generates_once_per_fingerprint(tmp_path: Path) -> None:
+    first = RoutesModuleCache(tmp_path / "cache")
+    module = first.load(ROUTES_JSON)
+
+    assert first.load(ROUTES_JSON) is module
+    assert first.stats["generated"] == 1
+    assert first.stats["reused"] == 1
+
+    # a second process sharing the directory imports the finished file
+    second = RoutesModuleCache(tmp_path / "cache")
+    assert second.load(ROUTES_JSON).react_router_path("/home") == "/home"
+    assert second.stats["generated"] == 0
+    assert second.stats["reused"] == 1
+    assert second.stats["saved_seconds"] > 0
+
+    assert sorted(path.suffix for path in (tmp_path / "cache").iterdir()) == [
+        ".json",
+        ".py",
+    ]
+
+
+def test_file_lock_breaks_stale_locks(tmp_path: Path) -> None:
+    lock = tmp_path / "routes.lock"
+    lock.write_text("12345")
+
+    with file_lock(lock, timeout=0.0):
+        assert lock.read_text() != "12345"
+
+    assert not lock.exists()
+
+
+def test_fixture_reports_saved_time(routes_pytester: pytest.Pytester) -> None:
+    pytester = routes_pytester
+    pytester.makeini("[pytest]\nreact_router_routes_json = routes.json\n")
+    pytester.makepyfile(test_one=TEST_MODULE, test_two=TEST_MODULE)
+
+    result = pytester.runpytest_subprocess("-p", "react_router_routes.pytest_plugin")
+
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "react-router-routes: generated 1 routes module(s), reused 1 time(s), saved *s of setup"
+        ]
+    )
+
+
+def test_plugin_is_opt_in(routes_pytester: pytest.Pytester) -> None:
+    pytester = routes_pytester
+    pytester.makepyfile(test_one=TEST_MODULE)
+
+    result = pytester.runpytest_subprocess()
+
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*fixture 'react_router_routes' not found*"])
+
+
+def test_fixture_shares_module_across_xdist_workers(
+    routes_pytester: pytest.Pytester,
+) -> None:
+    pytest.importorskip("xdist")
+    pytester = routes_pytester
+    pytester.makepyfile(**{f"test_{i}": TEST_MODULE for i in range(4)})
+
+    result = pytester.runpytest_subprocess(
+        "-p",
+        "react_router_routes.pytest_plugin",
+        "--react-router-routes-json",
+        "routes.json",
+        "-n",
+        "2",
+    )
+
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(
+        [
+            "react-router-routes: generated 1 routes module(s), reused 3 time(s), saved *s of setup"
+        ]
+    )
@@ -0,0 +1,142 @@
+"""Tests for the compiled redirect map."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+import typer
+
+from react_router_routes.generate import compile_redirects, generate_route_types
+
+PATTERNS = ["/people/:personId", "/files/*", "/settings/:tab?", "/o/:a/p/:b", "/help"]
+
+ROUTES_JSON = json.dumps(
+    [
+        {
+            "id": "root",
+            "path": "",
+            "file": "root.tsx",
+            "children": [
+                {"id": f"routes/{i}", "path": path, "file": f"routes/{i}.tsx"}
+                for i, path in enumerate(PATTERNS)
+            ],
+        }
+    ]
+)
+
+REDIRECTS = {
+    "/users/:userId": "/people/:personId",
+    "/users/:userId/profile": "/people/:personId",
+    "/docs/*": "/files/*",
+    "/preferences/:section?": "/settings/:tab?",
+    "/old/:b/:a": {"to": "/o/:a/p/:b"},
+    "/faq": "/help",
+}
+
+
+def _redirects_file(tmp_path: Path, redirects: dict) -> Path:
+    redirects_file = tmp_path / "redirects.json"
+    redirects_file.write_text(json.dumps(redirects))
+    return redirects_file
+
+
+def test_react_router_redirect(
+    tmp_path: Path, load_routes_module: Callable[..., ModuleType]
+) -> None:
+    routes_typing = load_routes_module(
+        ROUTES_JSON, redirects_file=_redirects_file(tmp_path, REDIRECTS)
+    )
+    redirect = routes_typing.react_router_redirect
+
+    assert redirect("/users/42") == "/people/42"
+    assert redirect("/Users/42/PROFILE/") == "/people/42"
+    assert redirect("/users/a%20b?tab=x#top") == "/people/a%20b?tab=x"
+    assert redirect("/docs/guides/intro.md") == "/files/guides/intro.md"
+    assert redirect("/preferences") == "/settings"
+    assert redirect("/preferences/privacy") == "/settings/privacy"
+    assert redirect("/old/2/1") == "/o/1/p/2"
+    assert redirect("/faq") == "/help"
+    assert redirect("https://example.com/users/5") == "/people/5"
+    assert redirect("//example.com/users/5?tab=x#top") == "/people/5?tab=x"
+    assert redirect("https://example.com") is None
+
+    assert redirect("/people/42") is None
+    assert redirect("/users") is None
+    assert redirect("/users/42/other") is None
+
+
+def test_redirects_are_omitted_without_mapping(tmp_path: Path) -> None:
+    output = tmp_path / "routes_typing.py"
+    generate_route_types(
+        output_file=output,
+        directory=None,
+        json_file=Path(__file__).parent / "react-router.json",
+    )
+
+    assert "def react_router_redirect" not in output.read_text()
+
+
+@pytest.mark.parametrize(
+    ("redirects", "message"),
+    [
+        ({"/u/:id": "/gone/:id"}, "is not a current route"),
+        ({"/help": "/help"}, "is still a current route"),
+        ({"/u": "/people/:personId"}, "has 0 params but the target takes 1"),
+        ({"/u/:id?": "/people/:personId"}, "from optional param id"),
+        ({"/u/:id": {"to": "/people/:personId"}}, "does not provide param personId"),
+        ({"/u/:id": {"to": "/files/*"}}, "needs a splat"),
+    ],
+)
+def test_compile_redirects_validation(redirects: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        compile_redirects(redirects, PATTERNS)
+
+
+def test_invalid_redirects_exit(
+    tmp_path: Path, load_routes_module: Callable[..., ModuleType]
+) -> None:
+    with pytest.raises(typer.Exit):
+        load_routes_module(
+            ROUTES_JSON, redirects_file=_redirects_file(tmp_path, {"/u": "/gone"})
+        )
+
+
+@pytest.mark.parametrize(
+    ("redirects", "message"),
+    [
+        (["/u/:id"], "expected an object"),
+        ({"/u/:id": 5}, "must be a pattern or an object"),
+        ({"/u/:id": {"to": "/people/:personId", "params": []}}, "must be an object"),
+    ],
+)
+def test_compile_redirects_shape(redirects: object, message: str) -> None:
+    with pytest.raises(TypeError, match=message):
+        compile_redirects(redirects, PATTERNS)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"/u/:a": 5}',
+        '["/u/:a"]',
+        '{"/u/:a": {"to": "/people/:personId", "params": ["a"]}}',
+        '{"/u/:a": ',
+    ],
+)
+def test_malformed_redirects_file_exits(
+    text: str,
+    tmp_path: Path,
+    load_routes_module: Callable[..., ModuleType],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    redirects_file = tmp_path / "redirects.json"
+    redirects_file.write_text(text)
+
+    with pytest.raises(typer.Exit):
+        load_routes_module(ROUTES_JSON, redirects_file=redirects_file)
+    assert "Invalid redirects:" in capsys.readouterr().err
+    assert not (tmp_path / "routes_typing.py").exists()
@@ -0,0 +1,121 @@
+"""Tests for stable integer route ids and compact route references."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+import typer
+
+from react_router_routes.generate import (
+    assign_route_ids,
+    route_ids_file,
+)
+
+
+def test_assign_route_ids_keeps_existing_and_never_reuses() -> None:
+    assert assign_route_ids(["/b", "/c"], {"/a": 1, "/b": 2}) == {
+        "/a": 1,
+        "/b": 2,
+        "/c": 3,
+    }
+
+
+def test_route_ids_stable_across_regenerations(
+    tmp_path: Path, load_routes_module: Callable[..., ModuleType]
+) -> None:
+    first = load_routes_module(["/home", "/users/:userId"])
+    assert route_ids_file(tmp_path / "routes_typing.py").exists()
+    assert first.RouteId.HOME == 2
+    assert first.RouteId.USERS_USER_ID == 3
+
+    second = load_routes_module(["/settings", "/users/:userId"])
+    assert second.ROUTE_IDS["/users/:userId"] == 3
+    assert second.ROUTE_IDS["/settings"] == 4
+    assert not hasattr(second.RouteId, "HOME")
+
+    lockfile = json.loads(route_ids_file(tmp_path / "routes_typing.py").read_text())
+    assert lockfile["routes"] == {
+        "/": 1,
+        "/home": 2,
+        "/users/:userId": 3,
+        "/settings": 4,
+    }
+
+
+def test_route_ref_roundtrip(load_routes_module: Callable[..., ModuleType]) -> None:
+    routes_typing = load_routes_module(
+        ["/orgs/:orgId/projects/:projectId", "/optional/:id?", "/files/*"]
+    )
+
+    ref = routes_typing.route_ref(
+        "/orgs/:orgId/projects/:projectId", {"org_id": 1, "project_id": "a b"}
+    )
+    assert ref == (2, 1, "a b")
+
+    decoded = json.loads(json.dumps(ref))
+    assert routes_typing.route_ref_path(decoded) == "/orgs/1/projects/a%20b"
+    assert (
+        routes_typing.route_ref_url(
+            decoded, base_url="https://example.com", url_params={"tab": "x"}
+        )
+        == "https://example.com/orgs/1/projects/a%20b?tab=x"
+    )
+
+    optional_ref = routes_typing.route_ref("/optional/:id?")
+    assert optional_ref == (3, None)
+    assert routes_typing.route_ref_path(optional_ref) == "/optional"
+    assert routes_typing.route_ref_path(
+        routes_typing.route_ref("/files/*", {"splat": "docs/a.md"})
+    ) == ("/files/docs/a.md")
+
+
+def test_route_ref_unknown_ids(load_routes_module: Callable[..., ModuleType]) -> None:
+    load_routes_module(["/old", "/users/:userId"])
+    routes_typing = load_routes_module(["/users/:userId"])
+
+    with pytest.raises(LookupError, match="retired route id: 2"):
+        routes_typing.route_ref_path([2])
+
+    with pytest.raises(LookupError, match="unknown or retired route id: 99"):
+        routes_typing.route_ref_path([99])
+
+    with pytest.raises(AssertionError, match="missing required param: user_id"):
+        routes_typing.route_ref_path([3, None])
+
+
+def test_route_ref_validates_params(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(["/users/:userId", "/optional/:id?"])
+
+    # original token keys are accepted like in react_router_path
+    assert routes_typing.route_ref("/users/:userId", {"userId": 1}) == (2, 1)
+
+    with pytest.raises(AssertionError, match="missing required param: user_id"):
+        routes_typing.route_ref("/users/:userId")
+
+    with pytest.raises(AssertionError, match="missing required param: user_id"):
+        routes_typing.route_ref("/users/:userId", {"user_id": None})
+
+    with pytest.raises(TypeError, match="unexpected params for /users/:userId: uid"):
+        routes_typing.route_ref("/users/:userId", {"user_id": 1, "uid": 1})
+
+    assert routes_typing.route_ref("/optional/:id?", {"id": None}) == (3, None)
+
+
+def test_route_ids_not_written_when_render_fails(
+    tmp_path: Path, load_routes_module: Callable[..., ModuleType]
+) -> None:
+    redirects = tmp_path / "redirects.json"
+    redirects.write_text(json.dumps({"/old": "/gone"}))
+
+    with pytest.raises(typer.Exit):
+        load_routes_module(["/home"], redirects_file=redirects)
+
+    output = tmp_path / "routes_typing.py"
+    assert not route_ids_file(output).exists()
+    assert not output.exists()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from react_router_routes.generate import (
+    compile_pattern_parts,
+    unique_route_names,
+)
+
+ROUTES_JSON = """[
+  {
+    "id": "root",
+    "path": "",
+    "file": "root.tsx",
+    "children": [
+      {"id": "routes/index", "index": true, "file": "routes/index.tsx"},
+      {"id": "routes/user", "path": "/user/:userId", "file": "routes/user.tsx"},
+      {"id": "routes/files", "path": "/files/*", "file": "routes/files.tsx"},
+      {"id": "routes/optional", "path": "/optional/:id?", "file": "routes/optional.tsx"},
+      {"id": "routes/middle", "path": "/a/:x?/b", "file": "routes/middle.tsx"},
+      {
+        "id": "routes/project",
+        "path": "/orgs/:orgId/projects/:projectId",
+        "file": "routes/project.tsx"
+      },
+      {"id": "routes/settings", "path": "/settings", "file": "routes/settings.tsx"},
+      {"id": "routes/not-found", "path": "/404", "file": "routes/not-found.tsx"}
+    ]
+  }
+]"""
+
+
+def test_compile_pattern_parts() -> None:
+    assert compile_pattern_parts("/orgs/:orgId/projects/:projectId?") == (
+        [("/orgs/", "org_id", "required"), ("/projects/", "project_id", "optional")],
+        "",
+    )
+    assert compile_pattern_parts("/files/*") == ([("/files/", "splat", "splat")], "")
+    assert compile_pattern_parts("/home") == ([], "/home")
+
+
+def test_unique_route_names() -> None:
+    names = unique_route_names(["/user/:id", "/user/:id?", "/404"])
+    assert names == {"/user/:id": "UserId", "/user/:id?": "UserId2", "/404": "Route404"}
+
+
+def test_route_objects_match_react_router_path(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(ROUTES_JSON)
+    Routes = routes_typing.Routes
+    react_router_path = routes_typing.react_router_path
+
+    cases = [
+        (Routes.Root, {}),
+        (Routes.UserUserId, {"user_id": "a b/c"}),
+        (Routes.FilesSplat, {"splat": "docs/read me.md"}),
+        (Routes.OptionalId, {}),
+        (Routes.OptionalId, {"id": 7}),
+        (Routes.AXB, {}),
+        (Routes.AXB, {"x": "1"}),
+        (Routes.OrgsOrgIdProjectsProjectId, {"org_id": 1, "project_id": 2}),
+    ]
+    for route, params in cases:
+        assert route.path(**params) == react_router_path(route.pattern, params)
+
+    assert (
+        Routes.UserUserId.path(user_id=1, url_params={"tab": "profile"})
+        == "/user/1?tab=profile"
+    )
+    assert (
+        Routes.UserUserId.url(user_id=1, base_url="https://example.com/")
+        == "https://example.com/user/1"
+    )
+    assert routes_typing.ROUTES_BY_PATTERN["/user/:userId"] is Routes.UserUserId
+
+
+def test_route_objects_param_errors(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(ROUTES_JSON)
+    Routes = routes_typing.Routes
+
+    with pytest.raises(TypeError, match="user_id"):
+        Routes.UserUserId.path()
+
+    with pytest.raises(AssertionError, match="missing required param: user_id"):
+        Routes.UserUserId.path(user_id=None)
+
+    with pytest.raises(TypeError, match="userId"):
+        Routes.UserUserId.path(user_id=1, userId=1)
+
+
+def test_route_objects_share_a_class_per_params_shape(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(ROUTES_JSON)
+    Routes = routes_typing.Routes
+
+    assert type(Routes.Root) is type(Routes.Settings)
+    assert type(Routes.UserUserId) is not type(Routes.OptionalId)
+    assert Routes.OptionalId.path(id=None) == "/optional"
+    assert repr(Routes.UserUserId) == "_UserUserIdRoute('/user/:userId')"
+
+
+def test_route_objects_rename_reserved_keywords(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(
+        ["/proxy/:baseUrl", "/q/:urlParams?", "/me/:self"]
+    )
+    Routes = routes_typing.Routes
+
+    assert (
+        Routes.ProxyBaseUrl.url(base_url_="a b", base_url="https://example.com")
+        == "https://example.com/proxy/a%20b"
+    )
+    assert Routes.QUrlParams.path(url_params_=1, url_params={"x": "y"}) == "/q/1?x=y"
+    assert Routes.MeSelf.path(self_=2) == "/me/2"
+    assert routes_typing.react_router_path("/proxy/:baseUrl", {"base_url": 4}) == (
+        "/proxy/4"
+    )
+
+
+@pytest.mark.skipif(shutil.which("pyright") is None, reason="pyright not installed")
+def test_route_objects_are_type_checked(
+    tmp_path: Path, load_routes_module: Callable[..., ModuleType]
+) -> None:
+    load_routes_module(ROUTES_JSON)
+    (tmp_path / "usage.py").write_text(
+        "from routes_typing import Routes\n"
+        "Routes.UserUserId.path(user_id=1)\n"
+        "Routes.OptionalId.url(base_url='https://example.com')\n"
+        "Routes.UserUserId.path(userId=1)\n"
+        "Routes.Settings.path(user_id=1)\n"
+    )
+    (tmp_path / "pyrightconfig.json").write_text('{"include": ["usage.py"]}')
+
+    result = subprocess.run(
+        ["pyright", "--project", str(tmp_path)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    errors = [line for line in result.stdout.splitlines() if " - error:" in line]
+    assert [line.split(":")[1] for line in errors] == ["4", "4", "5"], result.stdout
+
+
+def test_static_route_constants(load_routes_module: Callable[..., ModuleType]) -> None:
+    routes_typing = load_routes_module(ROUTES_JSON)
+
+    assert routes_typing.ROOT_PATH == "/"
+    assert routes_typing.SETTINGS_PATH == "/settings"
+    assert routes_typing.ROUTE404_PATH == "/404"
+    assert not hasattr(routes_typing, "USER_USER_ID_PATH")
@@ -0,0 +1,110 @@
+"""Tests for the runtime RouteTable."""
+
+from __future__ import annotations
+
+import gc
+import os
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from react_router_routes import RouteTable, RouteTableHandle
+from react_router_routes.matcher import RouteMatch
+
+ROUTES_JSON = """[
+  {
+    "id": "root",
+    "path": "",
+    "file": "root.tsx",
+    "children": [
+      {"id": "routes/index", "index": true, "file": "routes/index.tsx"},
+      {"id": "routes/user", "path": "/user/:userId", "file": "routes/user.tsx"},
+      {"id": "routes/files", "path": "/files/*", "file": "routes/files.tsx"},
+      {"id": "routes/optional", "path": "/optional/:id?", "file": "routes/optional.tsx"},
+      {"id": "routes/middle", "path": "/a/:x?/b", "file": "routes/middle.tsx"},
+      {
+        "id": "routes/project",
+        "path": "/orgs/:orgId/projects/:projectId",
+        "file": "routes/project.tsx"
+      }
+    ]
+  }
+]"""
+
+CASES: list[tuple[str, dict[str, object]]] = [
+    ("/", {}),
+    ("/user/:userId", {"user_id": "a b/c"}),
+    ("/user/:userId", {"userId": 5}),
+    ("/files/*", {"splat": "docs//read me.md/"}),
+    ("/optional/:id?", {}),
+    ("/optional/:id?", {"id": "café"}),
+    ("/a/:x?/b", {}),
+    ("/a/:x?/b", {"x": ""}),
+    ("/orgs/:orgId/projects/:projectId", {"org_id": 1, "project_id": 2, "extra": 3}),
+]
+
+
+def test_route_table_matches_generated_builders(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(ROUTES_JSON)
+
+    table = RouteTable.from_json(ROUTES_JSON)
+    assert list(table) == list(routes_typing.ROUTES_BY_PATTERN)
+
+    for pattern, params in CASES:
+        assert table.path(pattern, params) == routes_typing.react_router_path(
+            pattern, params
+        )
+        assert table.url(
+            pattern, params, base_url="https://example.com/", url_params={"q": "a b"}
+        ) == routes_typing.react_router_url(
+            pattern, params, base_url="https://example.com/", url_params={"q": "a b"}
+        )
+
+
+def test_route_table_from_json_inputs_and_match() -> None:
+    table = RouteTable.from_json(ROUTES_JSON)
+
+    assert len(table) == 6
+    assert "/user/:userId" in table
+    assert RouteTable.from_json(ROUTES_JSON.encode()).patterns == table.patterns
+    assert table.match("/user/42") == RouteMatch("/user/:userId", {"user_id": "42"})
+    assert table.match("/nope") is None
+
+    with pytest.raises(AssertionError, match="missing required param: user_id"):
+        table.path("/user/:userId")
+
+
+def test_manifest_roundtrip_and_hot_swap(tmp_path: Path) -> None:
+    manifest = tmp_path / "routes.manifest.json"
+    RouteTable.from_json(ROUTES_JSON).save_manifest(manifest)
+
+    handle = RouteTableHandle.from_manifest(manifest)
+    original = handle.table
+    assert "/user/:userId" in original
+    assert handle.reload_if_changed() is False
+
+    RouteTable(["/people/:personId"]).save_manifest(manifest)
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert handle.reload_if_changed() is True
+    assert handle.table is not original
+    assert list(handle.table) == ["/people/:personId"]
+    # a reader that grabbed the old table keeps a consistent view
+    assert original.path("/user/:userId", {"user_id": 1}) == "/user/1"
+
+    assert handle.swap(original).patterns == ("/people/:personId",)
+    assert handle.table is original
+
+
+def test_freeze_returns_table() -> None:
+    table = RouteTable.from_json(ROUTES_JSON)
+    try:
+        assert table.freeze() is table
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
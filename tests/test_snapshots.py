@@ -0,0 +1,116 @@
+"""Tests for versioned route snapshots."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import typer
+
+from react_router_routes.generate import generate_route_types
+from react_router_routes.snapshots import RouteSnapshotStore, SnapshotMatch
+
+
+def test_match_reports_releases_per_pattern() -> None:
+    store = RouteSnapshotStore()
+    store.add("1.0", ["/", "/users/:userId", "/blog/:slug"])
+    store.add("2.0", ["/", "/people/:personId", "/blog/:slug"])
+    store.add("3.0", ["/", "/people/:personId", "/posts/*"])
+
+    assert store.match("/users/42?ref=email") == [
+        SnapshotMatch("/users/:userId", {"user_id": "42"}, ("1.0",))
+    ]
+    assert store.match("/blog/hello") == [
+        SnapshotMatch("/blog/:slug", {"slug": "hello"}, ("1.0", "2.0"))
+    ]
+    assert store.match("/") == [SnapshotMatch("/", {}, ("1.0", "2.0", "3.0"))]
+    assert store.match("/nope/1") == []
+    assert store.patterns("3.0") == ["/", "/people/:personId", "/posts/*"]
+
+
+def test_add_existing_release_replaces_it() -> None:
+    store = RouteSnapshotStore()
+    store.add("1.0", ["/", "/old"])
+    store.add("1.0", ["/", "/new"])
+
+    assert store.releases == ("1.0",)
+    assert store.patterns("1.0") == ["/", "/new"]
+    assert store.match("/old") == []
+
+
+def test_prune_keeps_newest_releases() -> None:
+    store = RouteSnapshotStore()
+    store.add("1.0", ["/", "/legacy"])
+    store.add("2.0", ["/", "/users/:userId"])
+    store.add("3.0", ["/", "/users/:userId"])
+
+    assert store.prune(2) == ["1.0"]
+    assert store.releases == ("2.0", "3.0")
+    assert store.match("/legacy") == []
+    assert store.match("/users/1")[0].releases == ("2.0", "3.0")
+    assert store.prune(5) == []
+
+
+def test_store_round_trip_stays_compact(tmp_path: Path) -> None:
+    path = tmp_path / "routes.snapshots.json"
+    store = RouteSnapshotStore.load(path)
+    shared = [f"/section{i}/:itemId" for i in range(200)]
+    for release in range(300):
+        store.add(f"1.{release}", [*shared, f"/promo{release}"])
+    store.save(path)
+
+    loaded = RouteSnapshotStore.load(path)
+
+    assert len(loaded) == 300
+    assert loaded.match("/section7/x")[0].releases == loaded.releases
+    assert loaded.match("/promo123")[0].releases == ("1.123",)
+    # each pattern is stored once, not once per release
+    assert len(json.loads(path.read_text())["patterns"]) == 500
+    assert path.stat().st_size < 50_000
+
+
+def test_generate_records_snapshot(tmp_path: Path) -> None:
+    json_path = Path(__file__).parent / "react-router.json"
+    store_path = tmp_path / "routes.snapshots.json"
+
+    for version in ("1.0", "1.1"):
+        generate_route_types(
+            output_file=tmp_path / "routes_typing.py",
+            directory=None,
+            json_file=json_path,
+            snapshot_store=store_path,
+            snapshot_version=version,
+        )
+
+    store = RouteSnapshotStore.load(store_path)
+    assert store.releases == ("1.0", "1.1")
+    assert store.match("/home")[0].releases == ("1.0", "1.1")
+
+
+@pytest.mark.parametrize(
+    ("store_name", "version", "message"),
+    [
+        ("routes.snapshots.json", None, "needs --snapshot-version"),
+        (None, "1.0", "needs --snapshot-store"),
+    ],
+)
+def test_generate_checks_snapshot_flags_first(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    store_name: str | None,
+    version: str | None,
+    message: str,
+) -> None:
+    with pytest.raises(typer.Exit):
+        generate_route_types(
+            output_file=tmp_path / "routes_typing.py",
+            directory=None,
+            json_file=Path(__file__).parent / "react-router.json",
+            snapshot_store=tmp_path / store_name if store_name else None,
+            snapshot_version=version,
+        )
+    assert message in capsys.readouterr().err
+
+    # neither the module, its id lockfile nor the store was written
+    assert list(tmp_path.iterdir()) == []
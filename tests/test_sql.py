@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import itertools
+import sqlite3
+from collections.abc import Callable
+from types import ModuleType
+
+import pytest
+
+from react_router_routes.sql import sql_path_template
+
+PATTERNS = [
+    "/",
+    "/users/:userId",
+    "/orgs/:orgId/projects/:projectId",
+    "/orgs/:orgId/settings/:tab?",
+    "/a/:x?/:y?/b",
+    "/files/*",
+    "/docs/:lang?/*",
+    "/it's/:id",
+]
+
+VALUES = [
+    None,
+    "",
+    "plain-OK_~.",
+    "a b",
+    "100%",
+    "héllo/✓",
+    "日本",
+    "a//b/",
+    "//",
+    "'quoted'",
+    0,
+    42,
+]
+
+
+def test_sqlite_matches_python_builder(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(PATTERNS, sql=True)
+
+    rows = list(itertools.product(VALUES, repeat=2))
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE export (n INTEGER PRIMARY KEY, a, b)")
+    connection.executemany("INSERT INTO export (a, b) VALUES (?, ?)", rows)
+
+    for pattern in PATTERNS:
+        route = routes_typing.ROUTES_BY_PATTERN[pattern]
+        names = [name for _, name, _ in route._parts]
+        columns = dict(zip(names, ["a", "b"], strict=False))
+        expression = routes_typing.react_router_sql(pattern, columns, dialect="sqlite")
+
+        results = connection.execute(f"SELECT {expression} FROM export ORDER BY n")
+        for row, (actual,) in zip(rows, results, strict=True):
+            values = list(row[: len(names)])
+            required_missing = any(
+                value is None and kind != "optional"
+                for value, (_, _, kind) in zip(values, route._parts, strict=True)
+            )
+            expected = None if required_missing else route._render_values(values)
+            assert actual == expected, (pattern, row)
+
+
+def test_react_router_sql_columns(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(PATTERNS, sql=True)
+    connection = sqlite3.connect(":memory:")
+
+    def select(expression: str) -> str:
+        return connection.execute(f"SELECT {expression}").fetchone()[0]
+
+    assert (
+        select(
+            routes_typing.react_router_sql(
+                "/orgs/:orgId/settings/:tab?",
+                {"org_id": "'acme'"},
+                dialect="sqlite",
+                base_url="https://example.com/",
+            )
+        )
+        == "https://example.com/orgs/acme/settings"
+    )
+    assert select(routes_typing.react_router_sql("/", dialect="sqlite")) == "/"
+
+    with pytest.raises(AssertionError, match="missing required param: user_id"):
+        routes_typing.react_router_sql("/users/:userId", {})
+
+    with pytest.raises(TypeError, match="unexpected params"):
+        routes_typing.react_router_sql(
+            "/users/:userId", {"user_id": "id", "userId": "id"}
+        )
+
+
+def test_postgresql_template() -> None:
+    template = sql_path_template("/users/:userId/*", "postgresql")
+
+    assert "regexp_replace(" in template
+    assert "convert_to(CAST({user_id} AS TEXT), 'UTF8')" in template
+    assert "{splat}" in template
+    template.format(user_id="id", splat="path")
@@ -0,0 +1,56 @@
+"""Concurrent use of the generated runtime."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+
+PATTERNS = ["/user/:userId", "/optional/:id?"]
+
+
+def test_builders_are_consistent_across_threads(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(PATTERNS)
+
+    def build(i: int) -> tuple[str, str, str]:
+        return (
+            routes_typing.react_router_path("/user/:userId", {"user_id": i}),
+            routes_typing.Routes.UserUserId.path(user_id=i),
+            routes_typing.react_router_url(
+                "/optional/:id?", {"id": f"a b{i}"}, base_url="https://example.com"
+            ),
+        )
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(build, range(2_000)))
+
+    for i, (path, route_path, url) in enumerate(results):
+        assert path == f"/user/{i}"
+        assert route_path == f"/user/{i}"
+        assert url == f"https://example.com/optional/a%20b{i}"
+
+
+def test_missing_base_url_warns_once_per_pattern(
+    load_routes_module: Callable[..., ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    routes_typing = load_routes_module(PATTERNS)
+    monkeypatch.delenv("BASE_URL", raising=False)
+
+    with patch.object(routes_typing.logger, "warning") as mock_warning:
+        for i in range(3):
+            assert (
+                routes_typing.react_router_url("/user/:userId", {"user_id": i})
+                == f"/user/{i}"
+            )
+        routes_typing.Routes.UserUserId.url(user_id=1)
+        routes_typing.react_router_url("/optional/:id?")
+
+    assert [c.args[1] for c in mock_warning.call_args_list] == [
+        "/user/:userId",
+        "/optional/:id?",
+    ]
@@ -0,0 +1,53 @@
+"""Tests for the grouped overload typing strategy."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import ModuleType
+
+from react_router_routes.generate import (
+    TypingStrategy,
+    render_routes_module,
+)
+
+PATTERNS = [
+    "/",
+    "/settings",
+    "/users/:userId",
+    "/people/:userId",
+    "/orgs/:orgId/projects/:projectId?",
+    "/files/*",
+]
+
+
+def test_grouped_typing_emits_one_overload_per_params_shape() -> None:
+    overloads = render_routes_module(PATTERNS).count("@overload")
+    grouped = render_routes_module(
+        PATTERNS, typing_strategy=TypingStrategy.grouped
+    ).count("@overload")
+
+    # per function: 3 shapes + any-params overload + no-params overload + fallback
+    assert grouped == 2 * 6
+    assert overloads == 2 * (2 * 4 + 2 + 1)
+
+
+def test_grouped_typing_literals() -> None:
+    content = render_routes_module(PATTERNS, typing_strategy=TypingStrategy.grouped)
+
+    assert (
+        'def react_router_path(path: Literal["/users/:userId", "/people/:userId"], '
+        "params: UsersUserIdParams" in content
+    )
+    assert 'def react_router_path(path: Literal["/", "/settings"], params: None' in (
+        content
+    )
+
+
+def test_grouped_typing_module_runs(
+    load_routes_module: Callable[..., ModuleType],
+) -> None:
+    routes_typing = load_routes_module(typing_strategy=TypingStrategy.grouped)
+
+    assert (
+        routes_typing.react_router_path("/home", url_params={"a": "b"}) == "/home?a=b"
+    )
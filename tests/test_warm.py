@@ -0,0 +1,205 @@
+"""Tests for the warm-cache subcommand, against a local stand-in server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+from typer.testing import CliRunner
+
+from react_router_routes.cli import subcommands
+from react_router_routes.table import RouteTable
+from react_router_routes.warm import RateLimiter, warm_targets, warm_urls
+
+pytest.importorskip("httpx")
+
+ROUTES_JSON = """[
+  {
+    "id": "root",
+    "path": "",
+    "file": "root.tsx",
+    "children": [
+      {"id": "routes/index", "index": true, "file": "routes/index.tsx"},
+      {"id": "routes/about", "path": "/about", "file": "routes/about.tsx"},
+      {"id": "routes/tab", "path": "/settings/:tab?", "file": "routes/tab.tsx"},
+      {"id": "routes/user", "path": "/users/:userId", "file": "routes/user.tsx"},
+      {"id": "routes/broken", "path": "/broken", "file": "routes/broken.tsx"}
+    ]
+  }
+]"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requested: ClassVar[list[str]] = []
+    connections: ClassVar[set[int]] = set()
+
+    def do_GET(self) -> None:
+        self.requested.append(self.path)
+        self.connections.add(self.client_address[1])
+        status = 500 if self.path == "/broken" else 200
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    _Handler.requested = []
+    _Handler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_warm_targets_static_and_sampled() -> None:
+    table = RouteTable.from_json(ROUTES_JSON)
+    params = {"/users/:userId": [{"user_id": i} for i in range(10)]}
+
+    targets = warm_targets(
+        table, params, base_url="https://example.com", sample=3, seed=1
+    )
+
+    static = [url for pattern, url in targets if pattern != "/users/:userId"]
+    assert static == [
+        "https://example.com/",
+        "https://example.com/about",
+        "https://example.com/settings",
+        "https://example.com/broken",
+    ]
+    users = [url for pattern, url in targets if pattern == "/users/:userId"]
+    assert len(users) == 3
+    assert all(url.startswith("https://example.com/users/") for url in users)
+
+    with pytest.raises(ValueError, match="unknown patterns: /nope"):
+        warm_targets(table, {"/nope": []}, base_url="https://example.com", sample=1)
+
+
+@pytest.mark.parametrize(
+    ("params", "message"),
+    [
+        ({"/users/:userId": [{"uid": 1}]}, "has unexpected params: uid"),
+        ({"/users/:userId": [{}]}, "is missing required param: user_id"),
+        ({"/users/:userId": [{"user_id": None}]}, "is missing required param"),
+        ({"/users/:userId": {"user_id": 1}}, "must be a list"),
+        ({"/users/:userId": [1]}, "must be an object"),
+        ([], "expected an object"),
+    ],
+)
+def test_warm_targets_rejects_bad_params(params: object, message: str) -> None:
+    table = RouteTable.from_json(ROUTES_JSON)
+
+    with pytest.raises((TypeError, ValueError), match=message):
+        warm_targets(table, params, base_url="https://example.com", sample=1)  # type: ignore[arg-type]
+
+
+def test_warm_cache_cli_reports_bad_params(tmp_path: Path) -> None:
+    routes_json = tmp_path / "routes.json"
+    routes_json.write_text(ROUTES_JSON)
+    params_file = tmp_path / "params.json"
+    params_file.write_text(json.dumps({"/users/:userId": [{"uid": 1}]}))
+
+    result = CliRunner().invoke(
+        subcommands,
+        [
+            "warm-cache",
+            "--base-url",
+            "https://example.com",
+            "--json-file",
+            str(routes_json),
+            "--params",
+            str(params_file),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid params file: params #0 for /users/:userId" in result.output
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+def test_warm_urls_reports_per_pattern(server: str) -> None:
+    targets = [("/users/:userId", f"{server}/users/{i}") for i in range(20)]
+    targets.append(("/broken", f"{server}/broken"))
+
+    stats = asyncio.run(warm_urls(targets, concurrency=2))
+
+    assert stats["/users/:userId"].statuses == {200: 20}
+    assert stats["/broken"].statuses == {500: 1}
+    assert sorted(_Handler.requested) == sorted(
+        url.removeprefix(server) for _, url in targets
+    )
+    # keep-alive: two workers reuse their connections
+    assert len(_Handler.connections) <= 2
+
+
+def test_warm_urls_counts_connection_errors() -> None:
+    stats = asyncio.run(
+        warm_urls([("/", "http://127.0.0.1:9/")], concurrency=1, timeout=1)
+    )
+
+    assert stats["/"].statuses == {"error": 1}
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    async def run() -> float:
+        limiter = RateLimiter(50, burst=1)
+        started = time.perf_counter()
+        for _ in range(6):
+            await limiter.acquire()
+        return time.perf_counter() - started
+
+    # the first token is available immediately, the other five take 1/50s each
+    assert asyncio.run(run()) >= 5 / 50 * 0.9
+
+
+def test_warm_cache_cli(server: str, tmp_path: Path) -> None:
+    routes_json = tmp_path / "routes.json"
+    routes_json.write_text(ROUTES_JSON)
+    params_file = tmp_path / "params.json"
+    params_file.write_text(json.dumps({"/users/:userId": [{"userId": "a b"}]}))
+    report = tmp_path / "report.json"
+
+    result = CliRunner().invoke(
+        subcommands,
+        [
+            "warm-cache",
+            "--base-url",
+            server,
+            "--json-file",
+            str(routes_json),
+            "--params",
+            str(params_file),
+            "--rate",
+            "100",
+            "--report",
+            str(report),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(_Handler.requested) == [
+        "/",
+        "/about",
+        "/broken",
+        "/settings",
+        "/users/a%20b",
+    ]
+    summary = json.loads(report.read_text())
+    assert summary["/broken"]["statuses"] == {"500": 1}
+    assert summary["/users/:userId"]["requests"] == 1
+    assert "/broken  1 req  500x1" in result.output